@@ -3,20 +3,30 @@ Processes voice transcriptions through LLM.
 """
 
 import logging
+import re
+from typing import Optional
 from multiprocessing import Queue
-from queue import Empty
-from collections import deque
-from dotenv import load_dotenv
 
 from llm import OllamaClient, OllamaModelConfig
 from agent.command_handler import CommandExecutor
-from utils import Config
-
-load_dotenv()
+from utils import setup_process_logging, Config
 
 ACTIVATION_PHRASE = Config.activation_phrase()
 DEACTIVATION_PHRASE = Config.deactivation_phrase()
 SAVE_PHRASE = Config.save_phrase()
+# session events carry no data, so the same payloads are sent every time
+SESSION_START = {"type": "session_start"}
+SESSION_END = {"type": "session_end"}
+SESSION_SAVE = {"type": "save"}
+# one pass over the transcription finds every command phrase it mentions
+_PHRASE_RE = re.compile(
+    "|".join(
+        re.escape(phrase)
+        for phrase in sorted(
+            {ACTIVATION_PHRASE, DEACTIVATION_PHRASE, SAVE_PHRASE}, key=len, reverse=True
+        )
+    )
+)
 
 
 class VoiceProcessor:
@@ -24,73 +34,61 @@ class VoiceProcessor:
     Processes voice transcriptions through LLM.
     """
 
-    def __init__(self, max_tokens: int = 100, window_queue: Queue = None):
-        self.context_window = deque(maxlen=max_tokens)
+    def __init__(self, window_queue: Queue = None):
         self.session_active = False
         self.llm_client = OllamaClient(OllamaModelConfig())
         self.command_executor = CommandExecutor(window_queue) if window_queue else None
 
-    def clear_context(self):
-        """Clear the context window"""
-        self.context_window.clear()
-
-    def add_to_context(self, text: str):
-        """Add new text to context window, splitting by words as rough token approximation"""
-        words = text.split()
-        self.context_window.extend(words)
-
-    def get_context(self) -> str:
-        """Get the current context window as a single string"""
-        return " ".join(list(self.context_window))
-
     def process_command(self, text: str):
         """Process potential command text"""
         if self.command_executor:
             self.command_executor.process_voice_input(text)
 
 
-def process_transcriptions(queue: Queue, window_queue: Queue, logger: logging.Logger):
+def process_transcriptions(
+    queue: Queue,
+    window_queue: Queue,
+    logger: logging.Logger,
+    log_queue: Optional[Queue] = None,
+):
     """
     Processes transcriptions from the queue and sends them to LLM.
     """
+    setup_process_logging(log_queue=log_queue)
     logger.info("Starting LLM processor")
     processor = VoiceProcessor(window_queue=window_queue)
 
-    timeout = Config.get_float("PROCESS_TIMEOUT", 5.0)
-
     while True:
         try:
-            text = queue.get(timeout=timeout)
+            # block until there is work; None asks the processor to stop
+            text = queue.get()
+            if text is None:
+                logger.info("Stopping LLM processor")
+                break
             logger.info("Processing transcription: %s", text)
+            phrases = set(_PHRASE_RE.findall(text.lower()))
 
-            if ACTIVATION_PHRASE in text.lower():
+            if ACTIVATION_PHRASE in phrases:
                 processor.session_active = True
                 logger.info("Session activated: Sending show window command")
-                window_queue.put({"type": "session_start"})
-                processor.clear_context()
+                window_queue.put(SESSION_START)
                 continue
-            elif DEACTIVATION_PHRASE in text.lower():
+            elif DEACTIVATION_PHRASE in phrases:
                 processor.session_active = False
-                processor.clear_context()
                 logger.info("Session deactivated: Sending hide window command")
-                window_queue.put({"type": "session_end"})
+                window_queue.put(SESSION_END)
                 continue
-            elif SAVE_PHRASE in text.lower():
+            elif SAVE_PHRASE in phrases:
                 processor.session_active = False
-                processor.clear_context()
                 logger.info("Session deactivated: Sending save command")
-                window_queue.put({"type": "save"})
+                window_queue.put(SESSION_SAVE)
                 continue
 
             if processor.session_active:
-                processor.add_to_context(text)
                 processor.process_command(text)
-                processor.clear_context()
             else:
                 logger.info(f"Waiting for activation phrase '{ACTIVATION_PHRASE}'")
 
-        except Empty:
-            continue
         # pylint: disable=broad-exception-caught
         except Exception as e:
             logger.error(f"Error processing transcription: {str(e)}", exc_info=True)
@@ -5,6 +5,7 @@ Qt window for displaying job applications
 import logging
 import multiprocessing
 from datetime import datetime
+from queue import Empty
 from typing import Dict
 
 # pylint: disable=no-name-in-module
@@ -35,6 +36,20 @@ from gui.main_window import MainWindow
 
 logger = logging.getLogger(__name__)
 
+QUEUE_POLL_MS = 100
+QUEUE_DRAIN_LIMIT = 64  # commands handled per tick, so a burst cannot stall the UI
+
+
+def drain_queue(command_queue: multiprocessing.Queue, limit: int = QUEUE_DRAIN_LIMIT):
+    """Take up to limit items that are already waiting, without blocking"""
+    items = []
+    for _ in range(limit):
+        try:
+            items.append(command_queue.get_nowait())
+        except Empty:
+            break
+    return items
+
 
 # pylint: disable=line-too-long
 # pylint: disable=invalid-name
@@ -190,6 +205,9 @@ class ApplicationCard(QFrame):
                 background-color: rgba(0, 0, 0, 0.1);
                 border-radius: 3px;
             }
+            QTextEdit[locked=true], QListWidget[locked=true] {
+                background-color: rgba(0, 0, 0, 0.05);
+            }
         """
         )
 
@@ -322,7 +340,7 @@ class JobApplicationWindow(DraggableWindow):
 
         self.queue_timer = QTimer(self)
         self.queue_timer.timeout.connect(self.check_queue)
-        self.queue_timer.start(100)
+        self.queue_timer.start(QUEUE_POLL_MS)
         logger.info("Queue timer started")
 
     def setup_ui(self):
@@ -544,75 +562,68 @@ class JobApplicationWindow(DraggableWindow):
                     break
 
     def check_queue(self):
-        """Process commands from the queue"""
-        try:
-            while not self.command_queue.empty():
-                command = self.command_queue.get_nowait()
-                logger.info("Received window command: %s", command)
-
-                if command["type"] == "session_start":
-                    logger.info("Showing window")
-                    self.show()
-                elif command["type"] == "session_end":
-                    logger.info("Hiding window")
-                    self.hide()
-                elif command["type"] == "save":
-                    logger.info("Saving application")
-                    self.save_application()
-                    self.main_window.refresh_applications()
-                    self.hide()
-                elif command["type"] == "update_title":
-                    logger.info("Updating application title: %s", command["title"])
-                    self.update_application(title=command["title"])
-                elif command["type"] == "update_status":
-                    logger.info("Updating application status: %s", command["status"])
-                    self.update_application(status=command["status"])
-                elif command["type"] == "update_url":
-                    logger.info("Updating application URL: %s", command["url"])
-                    self.update_application(url=command["url"])
-                elif command["type"] == "update_company":
-                    logger.info("Updating application company: %s", command["company"])
-                    self.update_application(company=command["company"])
-                elif command["type"] == "update_role":
-                    logger.info("Updating application role: %s", command["role"])
-                    self.update_application(role=command["role"])
-                elif command["type"] == "update_location":
-                    logger.info(
-                        "Updating application location: %s", command["location"]
-                    )
-                    self.update_application(location=command["location"])
-                elif command["type"] == "update_notes":
-                    logger.info("Updating application notes: %s", command["notes"])
-                    self.update_application(notes=command["notes"])
-                elif command["type"] == "update_description":
-                    logger.info(
-                        "Updating application description: %s", command["description"]
-                    )
-                    self.update_application(description=command["description"])
-                elif command["type"] == "update_question":
-                    logger.info(
-                        "Updating application question: %s", command["question"]
-                    )
-                    self.update_application(question=command["question"])
-                elif command["type"] == "update_answer":
-                    logger.info("Updating application answer: %s", command["answer"])
-                    self.update_application(answer=command["answer"])
-                elif command["type"] == "update_note":
-                    logger.info("Updating application note: %s", command["note"])
-                    self.update_application(notes=command["note"])
-                elif command["type"] == "update_check_url":
-                    logger.info(
-                        "Updating application check URL: %s", command["check_url"]
-                    )
-                    self.update_application(check_url=command["check_url"])
-                elif command["type"] == "update_duration":
-                    logger.info(
-                        "Updating application duration: %s", command["duration"]
-                    )
-                    self.update_application(duration=command["duration"])
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            logger.error("Error processing window command: %s", e)
+        """Process every command that arrived since the last tick"""
+        for command in drain_queue(self.command_queue):
+            try:
+                self.handle_command(command)
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                logger.error("Error processing window command: %s", e)
+
+    def handle_command(self, command: Dict):
+        """Apply a single window command"""
+        logger.info("Received window command: %s", command)
+
+        if command["type"] == "session_start":
+            logger.info("Showing window")
+            self.show()
+        elif command["type"] == "session_end":
+            logger.info("Hiding window")
+            self.hide()
+        elif command["type"] == "save":
+            logger.info("Saving application")
+            self.save_application()
+            self.main_window.refresh_applications()
+            self.hide()
+        elif command["type"] == "update_title":
+            logger.info("Updating application title: %s", command["title"])
+            self.update_application(title=command["title"])
+        elif command["type"] == "update_status":
+            logger.info("Updating application status: %s", command["status"])
+            self.update_application(status=command["status"])
+        elif command["type"] == "update_url":
+            logger.info("Updating application URL: %s", command["url"])
+            self.update_application(url=command["url"])
+        elif command["type"] == "update_company":
+            logger.info("Updating application company: %s", command["company"])
+            self.update_application(company=command["company"])
+        elif command["type"] == "update_role":
+            logger.info("Updating application role: %s", command["role"])
+            self.update_application(role=command["role"])
+        elif command["type"] == "update_location":
+            logger.info("Updating application location: %s", command["location"])
+            self.update_application(location=command["location"])
+        elif command["type"] == "update_notes":
+            logger.info("Updating application notes: %s", command["notes"])
+            self.update_application(notes=command["notes"])
+        elif command["type"] == "update_description":
+            logger.info("Updating application description: %s", command["description"])
+            self.update_application(description=command["description"])
+        elif command["type"] == "update_question":
+            logger.info("Updating application question: %s", command["question"])
+            self.update_application(question=command["question"])
+        elif command["type"] == "update_answer":
+            logger.info("Updating application answer: %s", command["answer"])
+            self.update_application(answer=command["answer"])
+        elif command["type"] == "update_note":
+            logger.info("Updating application note: %s", command["note"])
+            self.update_application(notes=command["note"])
+        elif command["type"] == "update_check_url":
+            logger.info("Updating application check URL: %s", command["check_url"])
+            self.update_application(check_url=command["check_url"])
+        elif command["type"] == "update_duration":
+            logger.info("Updating application duration: %s", command["duration"])
+            self.update_application(duration=command["duration"])
 
     def save_application(self):
         """Save the current application to the database"""
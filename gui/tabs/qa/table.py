@@ -17,6 +17,28 @@ from gui.widgets import TabNavigationLineEdit
 
 logger = logging.getLogger(__name__)
 
+_READONLY_CELL_QSS = """
+    QLineEdit {
+        background-color: transparent;
+        color: #8e8e8e;
+        border: none;
+        padding: 8px;
+        margin: 0;
+        font-size: 13px;
+    }
+"""
+
+_EDIT_CELL_QSS = """
+    QLineEdit {
+        background-color: transparent;
+        color: #ffffff;
+        border: none;
+        padding: 8px;
+        margin: 0;
+        font-size: 13px;
+    }
+"""
+
 
 class QATable(QTableWidget):
     """Table widget for displaying questions and answers"""
@@ -193,18 +215,7 @@ class QATable(QTableWidget):
         company_layout.setSpacing(0)
         company_edit = TabNavigationLineEdit(row, 1, self, company)
         company_edit.setReadOnly(True)
-        company_edit.setStyleSheet(
-            """
-            QLineEdit {
-                background-color: transparent;
-                color: #8e8e8e;
-                border: none;
-                padding: 8px;
-                margin: 0;
-                font-size: 13px;
-            }
-        """
-        )
+        company_edit.setStyleSheet(_READONLY_CELL_QSS)
         company_layout.addWidget(company_edit)
         self.setCellWidget(row, 1, company_widget)
 
@@ -214,7 +225,7 @@ class QATable(QTableWidget):
         role_layout.setSpacing(0)
         role_edit = TabNavigationLineEdit(row, 2, self, role)
         role_edit.setReadOnly(True)
-        role_edit.setStyleSheet(company_edit.styleSheet())
+        role_edit.setStyleSheet(_READONLY_CELL_QSS)
         role_layout.addWidget(role_edit)
         self.setCellWidget(row, 2, role_widget)
 
@@ -223,18 +234,7 @@ class QATable(QTableWidget):
         question_layout.setContentsMargins(0, 0, 0, 0)
         question_layout.setSpacing(0)
         question_edit = TabNavigationLineEdit(row, 3, self, question)
-        question_edit.setStyleSheet(
-            """
-            QLineEdit {
-                background-color: transparent;
-                color: #ffffff;
-                border: none;
-                padding: 8px;
-                margin: 0;
-                font-size: 13px;
-            }
-        """
-        )
+        question_edit.setStyleSheet(_EDIT_CELL_QSS)
         question_edit.textChanged.connect(lambda text: self.cell_edited(row, 3, text))
         question_layout.addWidget(question_edit)
         self.setCellWidget(row, 3, question_widget)
@@ -244,7 +244,7 @@ class QATable(QTableWidget):
         answer_layout.setContentsMargins(0, 0, 0, 0)
         answer_layout.setSpacing(0)
         answer_edit = TabNavigationLineEdit(row, 4, self, answer)
-        answer_edit.setStyleSheet(question_edit.styleSheet())
+        answer_edit.setStyleSheet(_EDIT_CELL_QSS)
         answer_edit.textChanged.connect(lambda text: self.cell_edited(row, 4, text))
         answer_layout.addWidget(answer_edit)
         self.setCellWidget(row, 4, answer_widget)
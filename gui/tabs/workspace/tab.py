@@ -392,6 +392,14 @@ class WorkspaceTab(QWidget):
             logger.error("Application not found for ID %d", self.current_application_id)
             return
 
+        # only rows whose text differs from the stored copy are written back
+        stored = {
+            q_id: (question, answer)
+            for q_id, question, answer in parent.db.get_questions_for_application(
+                self.current_application_id
+            )
+        }
+
         for question_id, question, answer in questions_list:
             if not question.strip() and not answer.strip():
                 logger.debug("Skipping empty question")
@@ -405,7 +413,7 @@ class WorkspaceTab(QWidget):
                 if new_question_id > 0:
                     self._update_qa_item_id(question, answer, new_question_id)
                     parent.emit_qa_add(self.current_application_id, new_question_id)
-            else:
+            elif stored.get(question_id) != (question, answer):
                 logger.info(
                     "Updating existing question ID %d: %s", question_id, question[:50]
                 )
@@ -414,11 +422,8 @@ class WorkspaceTab(QWidget):
                         self.current_application_id, question_id, question, answer
                     )
 
-        all_questions = parent.db.get_questions_for_application(
-            self.current_application_id
-        )
         current_question_ids = {q[0] for q in questions_list}
-        for q_id, _, _ in all_questions:
+        for q_id in stored:
             if q_id not in current_question_ids:
                 logger.info("Deleting question ID %d", q_id)
                 if parent.db.delete_question(q_id):
@@ -462,6 +467,7 @@ class WorkspaceTab(QWidget):
             logger.error("Could not find MainWindow parent with database connection")
             return
 
+        self.qa_list.flush()
         questions = parent.db.get_questions_for_application(app_id)
 
         self.qa_list.blockSignals(True)
@@ -494,6 +500,7 @@ class WorkspaceTab(QWidget):
             logger.error("Could not find MainWindow parent with database connection")
             return
 
+        self.qa_list.flush()
         questions = parent.db.get_questions_for_application(app_id)
 
         self.qa_list.blockSignals(True)
@@ -508,6 +515,8 @@ class WorkspaceTab(QWidget):
             self.pdf_viewer.show_message("No application selected")
             return
 
+        self.qa_list.flush()
+
         parent = self
         while parent:
             if type(parent).__name__ == "MainWindow":
@@ -722,6 +731,7 @@ class WorkspaceTab(QWidget):
         ):
             return
 
+        self.qa_list.flush()
         self.qa_list.blockSignals(True)
         try:
             parent = self
@@ -753,6 +763,7 @@ class WorkspaceTab(QWidget):
         ):
             return
 
+        self.qa_list.flush()
         self.qa_list.blockSignals(True)
         try:
             parent = self
@@ -842,6 +853,6 @@ class WorkspaceTab(QWidget):
                 and self.pdf_viewer.pdf_document.pageCount() > 0
             ):
                 logger.info("Tab shown, fitting PDF to height")
-                self.pdf_viewer.fit_to_height()
+                self.pdf_viewer.schedule_fit()
         finally:
             self._updating_application_selector = False
@@ -3,6 +3,8 @@ Input widgets with consistent styling and behavior
 """
 
 import logging
+from bisect import bisect_left, insort
+from dataclasses import dataclass
 
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import (
@@ -15,12 +17,69 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QScrollArea,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QEvent, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QEvent, QSize, QElapsedTimer
+from PyQt6.QtGui import QPainter, QColor, QPixmap, QFont
 
 from gui.dataclasses import ApplicationStatus
 
+try:
+    from sortedcontainers import SortedList
+except ImportError:
+
+    class SortedList(list):
+        """Minimal bisect-backed stand-in for sortedcontainers.SortedList"""
+
+        def add(self, value):
+            """Insert value keeping the list sorted"""
+            insort(self, value)
+
+        def remove(self, value):
+            """Remove value, raising ValueError if missing"""
+            del self[self.index(value)]
+
+        def index(self, value):
+            """Position of value, raising ValueError if missing"""
+            idx = bisect_left(self, value)
+            if idx == len(self) or self[idx] != value:
+                raise ValueError(f"{value!r} is not in list")
+            return idx
+
+
 logger = logging.getLogger(__name__)
 
+ROW_HEIGHT = 32  # fixed height of a dropdown option row
+NAV_REPEAT_MS = 16  # drop autorepeat arrow keys arriving faster than one frame
+
+ARROW_UP = "▲"
+ARROW_DOWN = "▼"
+
+_arrow_pixmaps = {}  # {(glyph, color, pixel_size): QPixmap}
+
+
+def arrow_pixmap(glyph: str, color: str, pixel_size: int) -> QPixmap:
+    """Render an arrow glyph once and reuse the pixmap for every toggle"""
+    key = (glyph, color, pixel_size)
+    pixmap = _arrow_pixmaps.get(key)
+    if pixmap is None:
+        ratio = QApplication.instance().devicePixelRatio()
+        side = 16
+        pixmap = QPixmap(int(side * ratio), int(side * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        font = QFont()
+        font.setPixelSize(pixel_size)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(0, 0, side, side, Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.end()
+
+        _arrow_pixmaps[key] = pixmap
+    return pixmap
+
 
 # pylint: disable=invalid-name
 class SearchBar(QLineEdit):
@@ -201,6 +260,68 @@ class DropdownScrollArea(QScrollArea):
         return super().event(event)
 
 
+@dataclass(slots=True)
+class _Opt:
+    """An ApplicationSelector entry"""
+
+    text: str
+    widget: "OptionWidget"
+    label: QLabel
+
+
+class OptionWidget(QWidget):
+    """Dropdown option that paints its own focus/selection background"""
+
+    SELECTED_COLOR = QColor("#404040")
+    FOCUSED_COLOR = QColor("#3a3a3a")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._focused = False
+        self._selected = False
+        self._hovered = False
+
+    def set_focused(self, focused: bool):
+        """Mark the option as keyboard-focused"""
+        if self._focused != focused:
+            self._focused = focused
+            self.update()
+
+    def set_selected(self, selected: bool):
+        """Mark the option as the current selection"""
+        if self._selected != selected:
+            self._selected = selected
+            self.update()
+
+    def enterEvent(self, event):
+        """Track hover for the background"""
+        self._hovered = True
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        """Track hover for the background"""
+        self._hovered = False
+        self.update()
+        super().leaveEvent(event)
+
+    def paintEvent(self, event):
+        """Draw the state background directly instead of going through QSS"""
+        if self._selected:
+            color = self.SELECTED_COLOR
+        elif self._focused or self._hovered:
+            color = self.FOCUSED_COLOR
+        else:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(self.rect(), 4, 4)
+        painter.end()
+
+
 class ApplicationSelector(QFrame):
     """Custom application selector widget with modern styling"""
 
@@ -212,9 +333,13 @@ class ApplicationSelector(QFrame):
 
         self.current_id = None
         self.current_text = "Select Application"
-        self.options = {}  # {app_id: {'text': display_text, 'widget': option_widget}}
+        self.options = {}  # {app_id: _Opt}
+        self._sorted_ids = SortedList()  # option ids in navigation order
         self.focused_id = None
         self.is_open = False
+        self._content_h = 8  # options layout top + bottom margins
+        self._nav_timer = QElapsedTimer()
+        self._nav_timer.start()
 
         self.setup_ui()
 
@@ -231,6 +356,10 @@ class ApplicationSelector(QFrame):
             else:
                 self.toggle_dropdown()
             event.accept()
+        elif event.key() in (Qt.Key.Key_Down, Qt.Key.Key_Up) and self._throttle_nav(
+            event
+        ):
+            event.accept()
         elif event.key() == Qt.Key.Key_Down:
             if not self.is_open:
                 self.show_dropdown()
@@ -244,45 +373,49 @@ class ApplicationSelector(QFrame):
         else:
             super().keyPressEvent(event)
 
+    def _throttle_nav(self, event):
+        """Return True if an autorepeated arrow key should be dropped"""
+        if event.isAutoRepeat() and self._nav_timer.elapsed() < NAV_REPEAT_MS:
+            return True
+        self._nav_timer.restart()
+        return False
+
+    def _nav_index(self):
+        """Index of the focused (or selected) option in _sorted_ids, or None"""
+        anchor = self.focused_id if self.focused_id is not None else self.current_id
+        if anchor is None or anchor not in self.options:
+            return None
+        return self._sorted_ids.index(anchor)
+
     def focus_next_option(self):
         """Focus the next option in the list without selecting it"""
-        if not self.options:
-            return
-
-        app_ids = sorted(self.options.keys())
+        app_ids = self._sorted_ids
         if not app_ids:
             return
 
-        try:
-            current_idx = app_ids.index(
-                self.focused_id if self.focused_id is not None else self.current_id
-            )
+        current_idx = self._nav_index()
+        if current_idx is None:
+            next_idx = 0
+        else:
             next_idx = current_idx + 1
             if next_idx >= len(app_ids):
                 return
-        except ValueError:
-            next_idx = 0
 
         self.focus_option(app_ids[next_idx])
 
     def focus_previous_option(self):
         """Focus the previous option in the list without selecting it"""
-        if not self.options:
-            return
-
-        app_ids = sorted(self.options.keys())
+        app_ids = self._sorted_ids
         if not app_ids:
             return
 
-        try:
-            current_idx = app_ids.index(
-                self.focused_id if self.focused_id is not None else self.current_id
-            )
+        current_idx = self._nav_index()
+        if current_idx is None:
+            prev_idx = len(app_ids) - 1
+        else:
             prev_idx = current_idx - 1
             if prev_idx < 0:
                 return
-        except ValueError:
-            prev_idx = len(app_ids) - 1
 
         self.focus_option(app_ids[prev_idx])
 
@@ -292,15 +425,9 @@ class ApplicationSelector(QFrame):
             return False
 
         if self.focused_id is not None and self.focused_id in self.options:
-            prev_option = self.options[self.focused_id]["widget"]
-            prev_option.setProperty("focused", "false")
-            prev_option.style().unpolish(prev_option)
-            prev_option.style().polish(prev_option)
+            self.options[self.focused_id].widget.set_focused(False)
 
-        option = self.options[app_id]["widget"]
-        option.setProperty("focused", "true")
-        option.style().unpolish(option)
-        option.style().polish(option)
+        self.options[app_id].widget.set_focused(True)
 
         self.focused_id = app_id
         return True
@@ -314,19 +441,11 @@ class ApplicationSelector(QFrame):
 
         self.dropdown.setFixedWidth(self.width())
 
-        content_height = min(300, self.options_layout.sizeHint().height() + 10)
+        content_height = min(300, self._content_h + 10)
 
         self.dropdown.setGeometry(pos.x(), pos.y() + 4, self.width(), content_height)
 
-        self.arrow_label.setStyleSheet(
-            """
-            QLabel {
-                color: #aaaaaa;
-                font-size: 10px;
-            }
-        """
-        )
-        self.arrow_label.setText("▲")
+        self.arrow_label.setPixmap(arrow_pixmap(ARROW_UP, "#aaaaaa", 10))
 
         if self.current_id is not None:
             self.focus_option(self.current_id)
@@ -334,7 +453,6 @@ class ApplicationSelector(QFrame):
         self.dropdown.show()
         self.dropdown.raise_()
         self.is_open = True
-        self.update()
 
     def hide_dropdown(self):
         """Hide the dropdown"""
@@ -343,32 +461,20 @@ class ApplicationSelector(QFrame):
             self.is_open = False
             self.focused_id = None
 
-            self.arrow_label.setStyleSheet(
-                """
-                QLabel {
-                    color: #aaaaaa;
-                    font-size: 10px;
-                }
-            """
-            )
-            self.arrow_label.setText("▼")
+            self.arrow_label.setPixmap(arrow_pixmap(ARROW_DOWN, "#aaaaaa", 10))
 
-            for option_data in self.options.values():
-                option = option_data["widget"]
-                option.setProperty("focused", "false")
-                option.style().unpolish(option)
-
-            self.update()
+            for opt in self.options.values():
+                opt.widget.set_focused(False)
 
     def add_option(self, text, app_id):
         """Add an option to the dropdown"""
         if app_id in self.options:
             return self.update_option(app_id, text)
 
-        option = QWidget()
+        option = OptionWidget()
+        option.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         option.setObjectName(f"option_{app_id}")
-        option.setProperty("class", "OptionWidget")
-        option.setProperty("selected", "false")
+        option.setFixedHeight(ROW_HEIGHT)
         option.setCursor(Qt.CursorShape.PointingHandCursor)
 
         layout = QHBoxLayout(option)
@@ -376,10 +482,13 @@ class ApplicationSelector(QFrame):
         layout.setSpacing(6)
 
         label = QLabel(text)
-        label.setWordWrap(True)
+        label.setTextFormat(Qt.TextFormat.PlainText)
+        label.setFixedHeight(ROW_HEIGHT - 12)
+        label.setMinimumWidth(1)  # clip long names instead of widening the popup
         layout.addWidget(label)
 
-        self.options[app_id] = {"text": text, "widget": option, "label": label}
+        self.options[app_id] = _Opt(text, option, label)
+        self._sorted_ids.add(app_id)
 
         def handle_option_click(e):
             if e.button() == Qt.MouseButton.LeftButton:
@@ -389,6 +498,7 @@ class ApplicationSelector(QFrame):
         option.mousePressEvent = handle_option_click
 
         self.options_layout.addWidget(option)
+        self._content_h += ROW_HEIGHT + self.options_layout.spacing()
 
         if len(self.options) == 1 and self.current_id is None:
             self.select_option(app_id)
@@ -398,9 +508,9 @@ class ApplicationSelector(QFrame):
         if app_id not in self.options:
             return False
 
-        self.options[app_id]["text"] = new_text
+        self.options[app_id].text = new_text
 
-        self.options[app_id]["label"].setText(new_text)
+        self.options[app_id].label.setText(new_text)
 
         if self.current_id == app_id:
             self.current_text = new_text
@@ -414,18 +524,12 @@ class ApplicationSelector(QFrame):
             return False
 
         if self.current_id is not None and self.current_id in self.options:
-            prev_option = self.options[self.current_id]["widget"]
-            prev_option.setProperty("selected", "false")
-            prev_option.style().unpolish(prev_option)
-            prev_option.style().polish(prev_option)
+            self.options[self.current_id].widget.set_selected(False)
 
-        option = self.options[app_id]["widget"]
-        option.setProperty("selected", "true")
-        option.style().unpolish(option)
-        option.style().polish(option)
+        self.options[app_id].widget.set_selected(True)
 
         self.current_id = app_id
-        self.current_text = self.options[app_id]["text"]
+        self.current_text = self.options[app_id].text
         self.selected_label.setText(self.current_text)
 
         self.hide_dropdown()
@@ -438,18 +542,12 @@ class ApplicationSelector(QFrame):
             return False
 
         if self.current_id is not None and self.current_id in self.options:
-            prev_option = self.options[self.current_id]["widget"]
-            prev_option.setProperty("selected", "false")
-            prev_option.style().unpolish(prev_option)
-            prev_option.style().polish(prev_option)
+            self.options[self.current_id].widget.set_selected(False)
 
-        option = self.options[app_id]["widget"]
-        option.setProperty("selected", "true")
-        option.style().unpolish(option)
-        option.style().polish(option)
+        self.options[app_id].widget.set_selected(True)
 
         self.current_id = app_id
-        self.current_text = self.options[app_id]["text"]
+        self.current_text = self.options[app_id].text
         self.selected_label.setText(self.current_text)
 
         self.hide_dropdown()
@@ -460,12 +558,14 @@ class ApplicationSelector(QFrame):
         if app_id not in self.options:
             return False
 
-        option = self.options[app_id]["widget"]
+        option = self.options[app_id].widget
         self.options_layout.removeWidget(option)
         option.setParent(None)
         option.deleteLater()
+        self._content_h -= ROW_HEIGHT + self.options_layout.spacing()
 
         del self.options[app_id]
+        self._sorted_ids.remove(app_id)
 
         if self.current_id == app_id:
             self.current_id = None
@@ -477,19 +577,27 @@ class ApplicationSelector(QFrame):
     def clear(self):
         """Clear all options"""
         self.blockSignals(True)
+        self.options_container.setUpdatesEnabled(False)
 
         try:
             if self.is_open:
                 self.hide_dropdown()
 
-            app_ids = list(self.options.keys())
-            for app_id in app_ids:
-                self.remove_option(app_id)
+            while (item := self.options_layout.takeAt(0)) is not None:
+                widget = item.widget()
+                if widget is not None:
+                    widget.setParent(None)
+                    widget.deleteLater()
+
+            self.options.clear()
+            self._sorted_ids.clear()
+            self._content_h = 8
 
             self.current_id = None
             self.current_text = "Select Application"
             self.selected_label.setText(self.current_text)
         finally:
+            self.options_container.setUpdatesEnabled(True)
             self.blockSignals(False)
 
     def eventFilter(self, obj, event):
@@ -544,15 +652,8 @@ class ApplicationSelector(QFrame):
         header_layout.addWidget(self.selected_label)
         header_layout.addStretch()
 
-        self.arrow_label = QLabel("▼")
-        self.arrow_label.setStyleSheet(
-            """
-            QLabel {
-                color: #aaaaaa;
-                font-size: 10px;
-            }
-        """
-        )
+        self.arrow_label = QLabel()
+        self.arrow_label.setPixmap(arrow_pixmap(ARROW_DOWN, "#aaaaaa", 10))
         header_layout.addWidget(self.arrow_label)
 
         layout.addWidget(self.header)
@@ -584,26 +685,11 @@ class ApplicationSelector(QFrame):
                 background-color: transparent;
             }
             
-            .OptionWidget {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
+            OptionWidget {
                 min-height: 20px;
             }
             
-            .OptionWidget:hover {
-                background-color: #3a3a3a;
-            }
-            
-            .OptionWidget[focused="true"] {
-                background-color: #3a3a3a;
-            }
-            
-            .OptionWidget[selected="true"] {
-                background-color: #404040;
-            }
-            
-            .OptionWidget QLabel {
+            OptionWidget QLabel {
                 color: #ffffff;
                 font-size: 13px;
                 padding: 2px 0px;
@@ -708,7 +794,8 @@ class StatusDropdown(QWidget):
         button_layout.setContentsMargins(12, 8, 12, 8)
 
         self.label = QLabel(self.current_status)
-        self.arrow = QLabel("▼")
+        self.arrow = QLabel()
+        self.arrow.setPixmap(arrow_pixmap(ARROW_DOWN, "white", 13))
         self.arrow.setFixedWidth(16)
         self.arrow.setAlignment(
             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
@@ -732,6 +819,7 @@ class StatusDropdown(QWidget):
         self.option_items = []
         for status in ApplicationStatus:
             option = QFrame()
+            option.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
             option.setCursor(Qt.CursorShape.PointingHandCursor)
             option.status_value = status.value
 
@@ -852,7 +940,7 @@ class StatusDropdown(QWidget):
         self.popup.show()
         self.is_popup_visible = True
 
-        self.arrow.setText("▲")
+        self.arrow.setPixmap(arrow_pixmap(ARROW_UP, "white", 13))
 
     def hide_popup(self):
         """Hide the popup menu"""
@@ -862,7 +950,7 @@ class StatusDropdown(QWidget):
         self.popup.hide()
         self.is_popup_visible = False
 
-        self.arrow.setText("▼")
+        self.arrow.setPixmap(arrow_pixmap(ARROW_DOWN, "white", 13))
 
     def select_option(self, status):
         """Select an option from the popup"""
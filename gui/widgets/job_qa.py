@@ -3,7 +3,7 @@ Widget for displaying a list of question-answer pairs
 """
 
 # pylint: disable=no-name-in-module
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -16,16 +16,119 @@ from PyQt6.QtWidgets import (
     QDialogButtonBox,
 )
 from PyQt6.QtGui import QFont
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, pyqtSlot
 
 from .paste import PlainPasteTextEdit
 
+MOUNT_BATCH = 20  # QAItems created per step while scrolling through long lists
+POOL_LIMIT = MOUNT_BATCH  # unmounted QAItems kept around for reuse
+
+# applied once on QAListWidget; QAItem children are matched by objectName
+_QA_ITEM_QSS = """
+    QAItem {
+        background-color: #ffffff;
+        border: 1px solid #e1e4e8;
+        border-radius: 6px;
+    }
+    QAItem:hover {
+        border-color: #0366d6;
+    }
+    QLabel#questionTag {
+        color: #0366d6;
+    }
+    QLabel#answerTag {
+        color: #28a745;
+    }
+    QLabel#questionText {
+        font-size: 10pt;
+        color: #24292e;
+        padding: 4px;
+    }
+    QLabel#answerText {
+        font-size: 10pt;
+        color: #586069;
+        padding: 4px;
+    }
+"""
+
+_QA_BUTTON_QSS = """
+    QPushButton#editBtn, QPushButton#deleteBtn {
+        background-color: #fafbfc;
+        border: 1px solid rgba(27, 31, 35, 0.15);
+        border-radius: 3px;
+        color: #24292e;
+        font-size: 8pt;
+    }
+    QPushButton#editBtn:hover {
+        background-color: #f3f4f6;
+    }
+    QPushButton#deleteBtn {
+        color: #d73a49;
+    }
+    QPushButton#deleteBtn:hover {
+        color: white;
+        background-color: #d73a49;
+    }
+"""
+
+_QA_LIST_QSS = """
+    QScrollArea {
+        border: 1px solid #ddd;
+        background-color: white;
+        border-radius: 5px;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: #f0f0f0;
+        width: 10px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:vertical {
+        background: #c0c0c0;
+        border-radius: 5px;
+        min-height: 20px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+    }
+    QPushButton#addButton {
+        background-color: #2ea44f;
+        color: white;
+        border: 1px solid rgba(27, 31, 35, 0.15);
+        border-radius: 12px;
+        font-size: 16px;
+        font-weight: bold;
+        padding: 0;
+        margin: 0;
+    }
+    QPushButton#addButton:hover {
+        background-color: #2c974b;
+    }
+    QPushButton#addButton:pressed {
+        background-color: #298e46;
+    }
+"""
+
+_QA_WIDGET_QSS = _QA_LIST_QSS + _QA_ITEM_QSS + _QA_BUTTON_QSS
+
+_QA_LABEL_FONT = None
+
+
+def qa_label_font() -> QFont:
+    """Shared Q:/A: tag font, built once a QApplication exists"""
+    global _QA_LABEL_FONT  # pylint: disable=global-statement
+    if _QA_LABEL_FONT is None:
+        _QA_LABEL_FONT = QFont("Arial", 10)
+    return _QA_LABEL_FONT
+
 
 class QAItem(QFrame):
     """Widget representing a question and answer pair"""
 
-    deleted = pyqtSignal(QWidget)  # sends itself to be deleted
-    edited = pyqtSignal(str, str, QWidget)  # sends new question, answer, and itself
+    # receivers find the item through sender()
+    deleted = pyqtSignal()
+    edited = pyqtSignal(str, str)  # new question, answer
 
     def __init__(self, question: str, answer: str, parent=None):
         super().__init__(parent)
@@ -41,82 +144,46 @@ class QAItem(QFrame):
 
         question_layout = QHBoxLayout()
         question_label = QLabel("<b>Q:</b>")
-        question_label.setFont(QFont("Arial", 10))
-        question_label.setStyleSheet("color: #0366d6;")
-        question_text = QLabel(self.question)
-        question_text.setWordWrap(True)
-        question_text.setStyleSheet(
-            """
-            font-size: 10pt;
-            color: #24292e;
-            padding: 4px;
-        """
-        )
+        question_label.setObjectName("questionTag")
+        question_label.setFont(qa_label_font())
+        self.question_text = QLabel(self.question)
+        self.question_text.setObjectName("questionText")
+        self.question_text.setWordWrap(True)
 
         question_layout.addWidget(question_label)
-        question_layout.addWidget(question_text, 1)
+        question_layout.addWidget(self.question_text, 1)
         layout.addLayout(question_layout)
 
-        if self.answer:
-            answer_layout = QHBoxLayout()
-            answer_label = QLabel("<b>A:</b>")
-            answer_label.setFont(QFont("Arial", 10))
-            answer_label.setStyleSheet("color: #28a745;")
-            answer_text = QLabel(self.answer)
-            answer_text.setWordWrap(True)
-            answer_text.setStyleSheet(
-                """
-                font-size: 10pt;
-                color: #586069;
-                padding: 4px;
-            """
-            )
-
-            answer_layout.addWidget(answer_label)
-            answer_layout.addWidget(answer_text, 1)
-            layout.addLayout(answer_layout)
+        # always built so rebind() can toggle it instead of rebuilding the item
+        self.answer_row = QWidget()
+        answer_layout = QHBoxLayout(self.answer_row)
+        answer_layout.setContentsMargins(0, 0, 0, 0)
+        answer_label = QLabel("<b>A:</b>")
+        answer_label.setObjectName("answerTag")
+        answer_label.setFont(qa_label_font())
+        self.answer_text = QLabel(self.answer)
+        self.answer_text.setObjectName("answerText")
+        self.answer_text.setWordWrap(True)
+
+        answer_layout.addWidget(answer_label)
+        answer_layout.addWidget(self.answer_text, 1)
+        layout.addWidget(self.answer_row)
+        self.answer_row.setVisible(bool(self.answer))
 
         # Buttons with improved styling
         button_layout = QHBoxLayout()
         button_layout.addStretch()
 
         edit_button = QPushButton("Edit")
+        edit_button.setObjectName("editBtn")
         edit_button.setMaximumWidth(60)
         edit_button.setMinimumHeight(24)
-        edit_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #fafbfc;
-                border: 1px solid rgba(27, 31, 35, 0.15);
-                border-radius: 3px;
-                color: #24292e;
-                font-size: 8pt;
-            }
-            QPushButton:hover {
-                background-color: #f3f4f6;
-            }
-        """
-        )
         edit_button.clicked.connect(self.edit_qa)
 
         delete_button = QPushButton("Delete")
+        delete_button.setObjectName("deleteBtn")
         delete_button.setMaximumWidth(60)
         delete_button.setMinimumHeight(24)
-        delete_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #fafbfc;
-                border: 1px solid rgba(27, 31, 35, 0.15);
-                border-radius: 3px;
-                color: #d73a49;
-                font-size: 8pt;
-            }
-            QPushButton:hover {
-                color: white;
-                background-color: #d73a49;
-            }
-        """
-        )
         delete_button.clicked.connect(self.delete_qa)
 
         button_layout.addWidget(edit_button)
@@ -124,19 +191,16 @@ class QAItem(QFrame):
         layout.addLayout(button_layout)
 
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
-        self.setStyleSheet(
-            """
-            QAItem {
-                background-color: #ffffff;
-                border: 1px solid #e1e4e8;
-                border-radius: 6px;
-            }
-            QAItem:hover {
-                border-color: #0366d6;
-            }
-        """
-        )
 
+    def rebind(self, question: str, answer: str):
+        """Show a different question-answer pair without rebuilding the widget"""
+        self.question = question
+        self.answer = answer
+        self.question_text.setText(question)
+        self.answer_text.setText(answer)
+        self.answer_row.setVisible(bool(answer))
+
+    @pyqtSlot()
     def edit_qa(self):
         """Edit this QA item"""
         dialog = QDialog(self)
@@ -167,11 +231,12 @@ class QAItem(QFrame):
             new_question = question_edit.toPlainText().strip()
             new_answer = answer_edit.toPlainText().strip()
             if new_question:
-                self.edited.emit(new_question, new_answer, self)
+                self.edited.emit(new_question, new_answer)
 
+    @pyqtSlot()
     def delete_qa(self):
         """Delete this QA item"""
-        self.deleted.emit(self)
+        self.deleted.emit()
 
 
 class QAListWidget(QScrollArea):
@@ -182,6 +247,7 @@ class QAListWidget(QScrollArea):
     def __init__(self, questions=None, parent=None):
         super().__init__(parent)
         self.questions = questions or []
+        self._pool = []  # hidden QAItems waiting to be rebound
         self.container = QWidget()
         self.layout = QVBoxLayout(self.container)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -206,70 +272,94 @@ class QAListWidget(QScrollArea):
         self.setMinimumHeight(200)
         self.setMaximumHeight(400)
 
-        self.setStyleSheet(
-            """
-            QScrollArea {
-                border: 1px solid #ddd;
-                background-color: white;
-                border-radius: 5px;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #f0f0f0;
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #c0c0c0;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-            QPushButton#addButton {
-                background-color: #2ea44f;
-                color: white;
-                border: 1px solid rgba(27, 31, 35, 0.15);
-                border-radius: 12px;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0;
-                margin: 0;
-            }
-            QPushButton#addButton:hover {
-                background-color: #2c974b;
-            }
-            QPushButton#addButton:pressed {
-                background-color: #298e46;
-            }
-        """
-        )
+        self.setStyleSheet(_QA_WIDGET_QSS)
+
+        bar = self.verticalScrollBar()
+        bar.valueChanged.connect(self._mount_visible)
+        bar.rangeChanged.connect(self._mount_visible)
 
-        self.update_questions(self.questions)
+        # mount the first rows once the event loop is running, so building the
+        # window is not blocked on QAItem construction
+        QTimer.singleShot(0, self._mount_visible)
 
     def update_questions(self, questions):
         """Update the list of questions"""
         self.questions = questions
 
-        for i in reversed(range(1, self.layout.count())):
-            item = self.layout.itemAt(i)
-            if item:
-                widget = item.widget()
+        # one layout + paint pass for the whole rebuild
+        self.container.setUpdatesEnabled(False)
+        try:
+            mounted = self.mounted_count()
+            keep = min(mounted, len(self.questions))
+
+            for i in range(keep):
+                question, answer = self.questions[i]
+                item = self.layout.itemAt(i + 1).widget()
+                if item.question != question or item.answer != answer:
+                    item.rebind(question, answer)
+
+            while self.layout.count() > keep + 1:
+                widget = self.layout.takeAt(keep + 1).widget()
                 if widget:
-                    widget.setParent(None)
+                    self._release(widget)
+
+            self._mount_visible()
+        finally:
+            self.container.setUpdatesEnabled(True)
+
+    def mounted_count(self):
+        """Number of questions that currently have a QAItem in the layout"""
+        return self.layout.count() - 1  # minus the header row
+
+    def index_of(self, item):
+        """Position of a mounted QAItem in self.questions, or -1"""
+        index = self.layout.indexOf(item)
+        return index - 1 if index > 0 else -1
+
+    @pyqtSlot()
+    def _mount_visible(self):
+        """Mount QAItems for the next batch of rows once the viewport nears them"""
+        mounted = self.mounted_count()
+        if mounted >= len(self.questions):
+            return
+
+        bar = self.verticalScrollBar()
+        if mounted and bar.value() < bar.maximum() - self.viewport().height():
+            return
+
+        items = [
+            self.create_qa_item(question, answer)
+            for question, answer in self.questions[mounted : mounted + MOUNT_BATCH]
+        ]
+        for qa_item in items:
+            self.layout.addWidget(qa_item)
+
+    def create_qa_item(self, question, answer):
+        """Get a connected QA item, reusing a pooled one when available"""
+        if self._pool:
+            qa_item = self._pool.pop()
+            qa_item.rebind(question, answer)
+            qa_item.show()
+            return qa_item
 
-        for question, answer in self.questions:
-            self.add_qa_item(question, answer)
+        qa_item = QAItem(question, answer, self)
+        qa_item.deleted.connect(self._item_deleted, Qt.ConnectionType.DirectConnection)
+        qa_item.edited.connect(self._item_edited, Qt.ConnectionType.DirectConnection)
+        return qa_item
+
+    def _release(self, qa_item):
+        """Hide an unmounted QA item and keep it for reuse"""
+        qa_item.hide()
+        if len(self._pool) < POOL_LIMIT:
+            self._pool.append(qa_item)
+        else:
+            qa_item.deleteLater()
 
     def add_qa_item(self, question, answer):
         """Add a QA item to the list"""
-        qa_item = QAItem(question, answer, self)
-        qa_item.deleted.connect(self.remove_qa_item)
-        qa_item.edited.connect(self.edit_qa_item)
-        self.layout.addWidget(qa_item)
+        self.layout.addWidget(self.create_qa_item(question, answer))
 
+    @pyqtSlot()
     def add_qa(self):
         """Add a new Q&A pair"""
         dialog = QDialog(self)
@@ -301,32 +391,40 @@ class QAListWidget(QScrollArea):
             answer = answer_edit.toPlainText().strip()
             if question:
                 self.questions.append((question, answer))
-                self.add_qa_item(question, answer)
+                if self.mounted_count() == len(self.questions) - 1:
+                    self.add_qa_item(question, answer)
                 self.qa_updated.emit(self.questions)
 
+    @pyqtSlot()
+    def _item_deleted(self):
+        """Remove the QAItem that emitted deleted"""
+        self.remove_qa_item(self.sender())
+
+    @pyqtSlot(str, str)
+    def _item_edited(self, new_question, new_answer):
+        """Apply an edit from the QAItem that emitted edited"""
+        self.edit_qa_item(new_question, new_answer, self.sender())
+
     def remove_qa_item(self, item):
         """Remove a QA item from the list"""
-        for i, (q, a) in enumerate(self.questions):
-            if q == item.question and a == item.answer:
-                del self.questions[i]
-                break
+        index = self.index_of(item)
+        if index != -1:
+            del self.questions[index]
 
-        item.setParent(None)
+        self.layout.removeWidget(item)
+        self._release(item)
         self.qa_updated.emit(self.questions)
 
     def edit_qa_item(self, new_question, new_answer, item):
         """Edit a QA item in the list"""
-        for i, (q, a) in enumerate(self.questions):
-            if q == item.question and a == item.answer:
-                self.questions[i] = (new_question, new_answer)
-                break
-
-        index = self.layout.indexOf(item)
+        index = self.index_of(item)
         if index != -1:
-            item.setParent(None)
-            new_item = QAItem(new_question, new_answer, self)
-            new_item.deleted.connect(self.remove_qa_item)
-            new_item.edited.connect(self.edit_qa_item)
-            self.layout.insertWidget(index, new_item)
+            self.questions[index] = (new_question, new_answer)
+
+        item.blockSignals(True)
+        try:
+            item.rebind(new_question, new_answer)
+        finally:
+            item.blockSignals(False)
 
         self.qa_updated.emit(self.questions)
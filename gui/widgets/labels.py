@@ -10,11 +10,22 @@ from PyQt6.QtGui import QFont
 
 logger = logging.getLogger(__name__)
 
+_SECTION_QSS = "color: #333; margin-top: 10px;"
+_SECTION_FONT = None
+
+
+def section_font() -> QFont:
+    """Shared section header font, built once a QApplication exists"""
+    global _SECTION_FONT  # pylint: disable=global-statement
+    if _SECTION_FONT is None:
+        _SECTION_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+    return _SECTION_FONT
+
 
 class SectionLabel(QLabel):
     """Section header label with consistent styling"""
 
     def __init__(self, text: str):
         super().__init__(text)
-        self.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-        self.setStyleSheet("color: #333; margin-top: 10px;")
+        self.setFont(section_font())
+        self.setStyleSheet(_SECTION_QSS)
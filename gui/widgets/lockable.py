@@ -5,12 +5,55 @@ Widgets that can be locked/unlocked
 import logging
 
 # pylint: disable=no-name-in-module
-from PyQt6.QtWidgets import QPushButton, QLineEdit, QTextEdit, QListWidget
-from PyQt6.QtCore import QSize
+from PyQt6.QtWidgets import (
+    QApplication,
+    QPushButton,
+    QLineEdit,
+    QTextEdit,
+    QListWidget,
+)
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QFont
 from .paste import PlainPasteLineEdit, PlainPasteTextEdit
 
 logger = logging.getLogger(__name__)
 
+LOCKED_GLYPH = "🔒"
+UNLOCKED_GLYPH = "⚡"
+ICON_SIZE = QSize(16, 16)
+
+_lock_icons = {}  # {locked: QIcon}
+
+
+def lock_icon(locked: bool) -> QIcon:
+    """Render the lock/unlock glyph once and reuse the icon for every toggle"""
+    icon = _lock_icons.get(locked)
+    if icon is None:
+        ratio = QApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(
+            int(ICON_SIZE.width() * ratio), int(ICON_SIZE.height() * ratio)
+        )
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        font = QFont()
+        font.setPixelSize(14)
+
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.drawText(
+            0,
+            0,
+            ICON_SIZE.width(),
+            ICON_SIZE.height(),
+            Qt.AlignmentFlag.AlignCenter,
+            LOCKED_GLYPH if locked else UNLOCKED_GLYPH,
+        )
+        painter.end()
+
+        icon = _lock_icons[locked] = QIcon(pixmap)
+    return icon
+
 
 class LockableField:
     """A field that can be locked"""
@@ -20,7 +63,9 @@ class LockableField:
         self.field_name = field_name
         self.is_locked = False
 
-        self.lock_button = QPushButton("⚡")
+        self.lock_button = QPushButton()
+        self.lock_button.setIcon(lock_icon(False))
+        self.lock_button.setIconSize(ICON_SIZE)
         self.lock_button.setProperty("lockButton", True)
         self.lock_button.setFixedSize(QSize(24, 24))
         self.lock_button.clicked.connect(self.toggle_lock)
@@ -28,18 +73,20 @@ class LockableField:
     def toggle_lock(self):
         """Toggle the lock state"""
         self.is_locked = not self.is_locked
-        self.lock_button.setText("🔒" if self.is_locked else "⚡")
+        self.lock_button.setIcon(lock_icon(self.is_locked))
 
         if isinstance(
             self.widget, (QLineEdit, PlainPasteLineEdit, QTextEdit, PlainPasteTextEdit)
         ):
             self.widget.setReadOnly(self.is_locked)
             if isinstance(self.widget, (QTextEdit, PlainPasteTextEdit)):
-                self.widget.setStyleSheet(
-                    "background-color: rgba(0, 0, 0, 0.05);" if self.is_locked else ""
-                )
+                self._set_locked_style()
         elif isinstance(self.widget, QListWidget):
             self.widget.setEnabled(not self.is_locked)
-            self.widget.setStyleSheet(
-                "background-color: rgba(0, 0, 0, 0.05);" if self.is_locked else ""
-            )
+            self._set_locked_style()
+
+    def _set_locked_style(self):
+        """Flip the `locked` property the parent stylesheet keys the tint on"""
+        self.widget.setProperty("locked", self.is_locked)
+        self.widget.style().unpolish(self.widget)
+        self.widget.style().polish(self.widget)
@@ -17,12 +17,11 @@ class PlainPasteLineEdit(QLineEdit):
 
     def keyPressEvent(self, event):
         """Override keyPressEvent to handle Ctrl+V (Command+V on Mac)"""
-        modifiers = QApplication.keyboardModifiers()
-        if event.key() == Qt.Key.Key_V and (
-            modifiers & Qt.KeyboardModifier.ControlModifier
+        if (
+            event.key() == Qt.Key.Key_V
+            and event.modifiers() & Qt.KeyboardModifier.ControlModifier
         ):
-            clipboard = QApplication.clipboard()
-            self.insert(clipboard.text())
+            self.insert(QApplication.clipboard().text())
             return
         super().keyPressEvent(event)
 
@@ -30,12 +29,7 @@ class PlainPasteLineEdit(QLineEdit):
 class PlainPasteTextEdit(QTextEdit):
     """TextEdit that pastes plain text"""
 
-    def keyPressEvent(self, event):
-        """Handle key press events"""
-        if (
-            event.key() == Qt.Key.Key_V
-            and event.modifiers() & Qt.KeyboardModifier.ControlModifier
-        ):
-            self.insertPlainText(QApplication.clipboard().text())
-        else:
-            super().keyPressEvent(event)
+    def insertFromMimeData(self, source):
+        """Insert only the plain-text part of pasted or dropped data"""
+        if source.hasText():
+            self.insertPlainText(source.text())
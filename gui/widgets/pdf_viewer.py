@@ -13,20 +13,151 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QLabel,
     QSizePolicy,
-    QStackedWidget,
 )
-from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtCore import Qt, QPointF, QTimer, pyqtSlot
 from PyQt6.QtPdfWidgets import QPdfView
 from PyQt6.QtPdf import QPdfDocument
 
 logger = logging.getLogger(__name__)
 
+_PDF_SCROLLAREA_QSS = """
+    QScrollArea {
+        border: none;
+        background-color: #262626;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: #2c2c2c;
+        width: 10px;
+        margin: 0;
+    }
+    QScrollBar::handle:vertical {
+        background: #404040;
+        border-radius: 5px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #4a4a4a;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0;
+        border: none;
+        background: none;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+    QScrollBar:horizontal {
+        border: none;
+        background: #2c2c2c;
+        height: 10px;
+        margin: 0;
+    }
+    QScrollBar::handle:horizontal {
+        background: #404040;
+        border-radius: 5px;
+        min-width: 20px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background: #4a4a4a;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0;
+        border: none;
+        background: none;
+    }
+    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+        background: none;
+    }
+"""
+
+_PDF_CONTENT_QSS = """
+    QWidget {
+        background-color: #262626;
+    }
+"""
+
+_PDF_MESSAGE_QSS = """
+    QLabel {
+        color: #8e8e8e;
+        font-size: 14px;
+        background-color: #262626;
+    }
+"""
+
+_PDF_VIEW_QSS = """
+    QPdfView {
+        background-color: #262626;
+        border: none;
+    }
+"""
+
+_PDF_PAGE_LABEL_QSS = """
+    QLabel {
+        color: #ffffff;
+        padding: 0 12px;
+        min-width: 80px;
+    }
+"""
+
+# set once on the controls container; every nav/zoom button inherits it
+_PDF_CONTROLS_QSS = """
+    QWidget {
+        background-color: #262626;
+        border-top: 1px solid #333333;
+    }
+    QPushButton {
+        background-color: #2c2c2c;
+        color: #ffffff;
+        border: 1px solid #404040;
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-size: 13px;
+        min-width: 60px;
+    }
+    QPushButton:hover {
+        background-color: #3c3c3c;
+        border-color: #4a4a4a;
+    }
+    QPushButton:pressed {
+        background-color: #404040;
+    }
+    QPushButton:disabled {
+        color: #666666;
+        border-color: #333333;
+        background-color: #2c2c2c;
+    }
+"""
+
+_PAGE_FMT = "Page {} of {}".format
+
+ZOOM_STEP = 1.2
+ZOOM_SETTLE_MS = 150  # zoom steps closer together than this are merged
+
 
 class PDFViewer(QScrollArea):
     """Widget for displaying PDF files"""
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # coalesces resize storms into a single measure + zoom pass
+        self._fit_timer = QTimer(self)
+        self._fit_timer.setSingleShot(True)
+        self._fit_timer.setInterval(0)
+        self._fit_timer.timeout.connect(self.fit_to_height)
+
+        # first zoom step applies at once, a burst of steps re-renders once more
+        self._zoom_target = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(ZOOM_SETTLE_MS)
+        self._zoom_timer.timeout.connect(self._commit_zoom)
+
+        # per-document values cached on load instead of queried per keystroke
+        self._page_count = 0
+        self._page_sizes = []
+        self._last_nav = None  # (current_page, page_count) last shown
+
         self.setup_ui()
         self.current_page = 0
         self.doc = None
@@ -36,81 +167,20 @@ class PDFViewer(QScrollArea):
     def setup_ui(self):
         """Setup the PDF viewer UI"""
         self.setWidgetResizable(True)
-        self.setStyleSheet(
-            """
-            QScrollArea {
-                border: none;
-                background-color: #262626;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #2c2c2c;
-                width: 10px;
-                margin: 0;
-            }
-            QScrollBar::handle:vertical {
-                background: #404040;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #4a4a4a;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0;
-                border: none;
-                background: none;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-            QScrollBar:horizontal {
-                border: none;
-                background: #2c2c2c;
-                height: 10px;
-                margin: 0;
-            }
-            QScrollBar::handle:horizontal {
-                background: #404040;
-                border-radius: 5px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #4a4a4a;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0;
-                border: none;
-                background: none;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-                background: none;
-            }
-        """
-        )
+        self.setStyleSheet(_PDF_SCROLLAREA_QSS)
 
         container = QWidget()
         self.layout = QVBoxLayout(container)
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(0)
 
-        self.stack = QStackedWidget()
-        self.stack.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-        )
-
         content_container = QWidget()
         content_container.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
-        content_container.setStyleSheet(
-            """
-            QWidget {
-                background-color: #262626;
-            }
-        """
-        )
+        content_container.setStyleSheet(_PDF_CONTENT_QSS)
 
+        # the message label and the PDF view are toggled by visibility
         content_layout = QVBoxLayout(content_container)
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.setSpacing(0)
@@ -120,48 +190,24 @@ class PDFViewer(QScrollArea):
         self.content.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
-        self.content.setStyleSheet(
-            """
-            QLabel {
-                color: #8e8e8e;
-                font-size: 14px;
-                background-color: #262626;
-            }
-        """
-        )
+        self.content.setStyleSheet(_PDF_MESSAGE_QSS)
         content_layout.addWidget(self.content)
 
-        pdf_container = QWidget()
-        pdf_container.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
-        )
-        pdf_layout = QVBoxLayout(pdf_container)
-        pdf_layout.setContentsMargins(0, 0, 0, 0)
-        pdf_layout.setSpacing(0)
-
-        self.pdf_view = QPdfView(pdf_container)
+        self.pdf_view = QPdfView(content_container)
         self.pdf_view.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
-        self.pdf_view.setStyleSheet(
-            """
-            QPdfView {
-                background-color: #262626;
-                border: none;
-            }
-        """
-        )
+        self.pdf_view.setStyleSheet(_PDF_VIEW_QSS)
         self.pdf_document = QPdfDocument(self)
         self.pdf_view.setDocument(self.pdf_document)
+        self._nav = self.pdf_view.pageNavigator()
 
         self.pdf_view.setPageMode(QPdfView.PageMode.SinglePage)
         self.pdf_view.setZoomMode(QPdfView.ZoomMode.Custom)
-        pdf_layout.addWidget(self.pdf_view)
+        self.pdf_view.hide()
+        content_layout.addWidget(self.pdf_view)
 
-        self.stack.addWidget(content_container)
-        self.stack.addWidget(pdf_container)
-
-        self.layout.addWidget(self.stack)
+        self.layout.addWidget(content_container)
 
         controls_layout = QHBoxLayout()
         controls_layout.setContentsMargins(8, 8, 8, 8)
@@ -170,52 +216,18 @@ class PDFViewer(QScrollArea):
         nav_layout = QHBoxLayout()
         nav_layout.setSpacing(4)
 
-        button_style = """
-            QPushButton {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-size: 13px;
-                min-width: 60px;
-            }
-            QPushButton:hover {
-                background-color: #3c3c3c;
-                border-color: #4a4a4a;
-            }
-            QPushButton:pressed {
-                background-color: #404040;
-            }
-            QPushButton:disabled {
-                color: #666666;
-                border-color: #333333;
-                background-color: #2c2c2c;
-            }
-        """
-
         self.prev_btn = QPushButton("←")
         self.prev_btn.setEnabled(False)
         self.prev_btn.clicked.connect(self.previous_page)
-        self.prev_btn.setStyleSheet(button_style)
         self.prev_btn.setFixedWidth(40)
 
         self.page_label = QLabel("Page 0 of 0")
-        self.page_label.setStyleSheet(
-            """
-            QLabel {
-                color: #ffffff;
-                padding: 0 12px;
-                min-width: 80px;
-            }
-        """
-        )
+        self.page_label.setStyleSheet(_PDF_PAGE_LABEL_QSS)
         self.page_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.next_btn = QPushButton("→")
         self.next_btn.setEnabled(False)
         self.next_btn.clicked.connect(self.next_page)
-        self.next_btn.setStyleSheet(button_style)
         self.next_btn.setFixedWidth(40)
 
         nav_layout.addWidget(self.prev_btn)
@@ -227,17 +239,14 @@ class PDFViewer(QScrollArea):
 
         self.zoom_out_btn = QPushButton("−")
         self.zoom_out_btn.clicked.connect(self.zoom_out)
-        self.zoom_out_btn.setStyleSheet(button_style)
         self.zoom_out_btn.setFixedWidth(40)
 
         self.zoom_in_btn = QPushButton("+")
         self.zoom_in_btn.clicked.connect(self.zoom_in)
-        self.zoom_in_btn.setStyleSheet(button_style)
         self.zoom_in_btn.setFixedWidth(40)
 
         self.fit_btn = QPushButton("Fit")
-        self.fit_btn.clicked.connect(self.fit_to_height)
-        self.fit_btn.setStyleSheet(button_style)
+        self.fit_btn.clicked.connect(self.schedule_fit)
         self.fit_btn.setFixedWidth(60)
 
         zoom_layout.addWidget(self.zoom_out_btn)
@@ -249,14 +258,7 @@ class PDFViewer(QScrollArea):
         controls_layout.addLayout(zoom_layout)
 
         controls_container = QWidget()
-        controls_container.setStyleSheet(
-            """
-            QWidget {
-                background-color: #262626;
-                border-top: 1px solid #333333;
-            }
-        """
-        )
+        controls_container.setStyleSheet(_PDF_CONTROLS_QSS)
         controls_container.setLayout(controls_layout)
 
         self.layout.addWidget(controls_container)
@@ -270,13 +272,14 @@ class PDFViewer(QScrollArea):
                 return
 
             self.pdf_document.load(path)
+            self._cache_document()
             self.current_page = 0
-            self.update_navigation()
 
-            if self.pdf_document.pageCount() > 0:
+            if self._page_count > 0:
                 self.show_pdf()
+                self.update_navigation()
                 logger.info("Automatically fitting to height")
-                self.fit_to_height()
+                self.schedule_fit()
             else:
                 self.show_message("Empty PDF document")
         # pylint: disable=broad-exception-caught
@@ -284,75 +287,128 @@ class PDFViewer(QScrollArea):
             logger.error("Error loading PDF: %s", str(e))
             self.show_message(f"Error loading PDF: {str(e)}")
             self.pdf_document.close()
+            self._cache_document()
+
+    def _cache_document(self):
+        """Snapshot page count and page sizes of the loaded document"""
+        self._page_count = self.pdf_document.pageCount()
+        self._page_sizes = [
+            self.pdf_document.pagePointSize(i) for i in range(self._page_count)
+        ]
 
     def show_message(self, message: str):
         """Show a message instead of PDF"""
-        self.content.setText(message)
-        self.stack.setCurrentIndex(0)
-        self.prev_btn.setEnabled(False)
-        self.next_btn.setEnabled(False)
-        self.zoom_in_btn.setEnabled(False)
-        self.zoom_out_btn.setEnabled(False)
-        self.fit_btn.setEnabled(False)
-        self.page_label.setText("No PDF loaded")
+        self.setUpdatesEnabled(False)
+        try:
+            self.content.setText(message)
+            self.pdf_view.hide()
+            self.content.show()
+            for button in (
+                self.prev_btn,
+                self.next_btn,
+                self.zoom_in_btn,
+                self.zoom_out_btn,
+                self.fit_btn,
+            ):
+                if button.isEnabled():
+                    button.setEnabled(False)
+            self.page_label.setText("No PDF loaded")
+            self._last_nav = None
+        finally:
+            self.setUpdatesEnabled(True)
 
     def show_pdf(self):
         """Show the PDF viewer"""
-        self.stack.setCurrentIndex(1)
+        self.content.hide()
+        self.pdf_view.show()
         self.zoom_in_btn.setEnabled(True)
         self.zoom_out_btn.setEnabled(True)
         self.fit_btn.setEnabled(True)
-        self.update_navigation()
 
     def update_navigation(self):
         """Update navigation buttons and page label"""
-        page_count = self.pdf_document.pageCount()
-        current_page = self.pdf_view.pageNavigator().currentPage()
+        page_count = self._page_count
+        current_page = self._nav.currentPage()
 
-        self.prev_btn.setEnabled(current_page > 0)
-        self.next_btn.setEnabled(current_page < page_count - 1)
+        if self._last_nav == (current_page, page_count):
+            return
+        self._last_nav = (current_page, page_count)
+
+        has_prev = current_page > 0
+        if self.prev_btn.isEnabled() != has_prev:
+            self.prev_btn.setEnabled(has_prev)
+        has_next = current_page < page_count - 1
+        if self.next_btn.isEnabled() != has_next:
+            self.next_btn.setEnabled(has_next)
 
         if page_count > 0:
-            self.page_label.setText(f"Page {current_page + 1} of {page_count}")
+            self.page_label.setText(_PAGE_FMT(current_page + 1, page_count))
         else:
             self.page_label.setText("No PDF loaded")
 
+    @pyqtSlot()
     def next_page(self):
         """Go to next page"""
-        nav = self.pdf_view.pageNavigator()
-        if nav.currentPage() < self.pdf_document.pageCount() - 1:
+        nav = self._nav
+        if nav.currentPage() < self._page_count - 1:
             nav.jump(nav.currentPage() + 1, QPointF())
             self.update_navigation()
 
+    @pyqtSlot()
     def previous_page(self):
         """Go to previous page"""
-        nav = self.pdf_view.pageNavigator()
+        nav = self._nav
         if nav.currentPage() > 0:
             nav.jump(nav.currentPage() - 1, QPointF())
             self.update_navigation()
 
+    @pyqtSlot()
     def zoom_in(self):
         """Zoom in the PDF view"""
-        current_zoom = self.pdf_view.zoomFactor()
-        self.pdf_view.setZoomFactor(current_zoom * 1.2)
+        self._step_zoom(ZOOM_STEP)
 
+    @pyqtSlot()
     def zoom_out(self):
         """Zoom out the PDF view"""
-        current_zoom = self.pdf_view.zoomFactor()
-        self.pdf_view.setZoomFactor(current_zoom / 1.2)
+        self._step_zoom(1 / ZOOM_STEP)
 
+    def _step_zoom(self, factor: float):
+        """Apply a zoom step, deferring re-rendering while steps keep coming"""
+        if self._zoom_timer.isActive():
+            self._zoom_target *= factor
+        else:
+            self._zoom_target = self.pdf_view.zoomFactor() * factor
+            self.pdf_view.setZoomFactor(self._zoom_target)
+        self._zoom_timer.start()
+
+    @pyqtSlot()
+    def _commit_zoom(self):
+        """Render the zoom level the last burst of steps settled on"""
+        if self._zoom_target != self.pdf_view.zoomFactor():
+            self.pdf_view.setZoomFactor(self._zoom_target)
+
+    @pyqtSlot()
+    def schedule_fit(self):
+        """Queue a fit_to_height, merging repeated requests into one"""
+        self._fit_timer.start()
+
+    def resizeEvent(self, event):
+        """Refit the page once the resize settles"""
+        super().resizeEvent(event)
+        if self._page_count:
+            self.schedule_fit()
+
+    @pyqtSlot()
     def fit_to_height(self):
         """Fit the PDF page to the view height"""
-        if not self.pdf_document.pageCount():
+        if not self._page_count:
             return
+        self._zoom_timer.stop()
 
-        page_size = self.pdf_document.pagePointSize(
-            self.pdf_view.pageNavigator().currentPage()
-        )
+        # read everything first, then write once
+        page_size = self._page_sizes[self._nav.currentPage()]
         if not page_size.isValid():
             return
-
         view_height = self.pdf_view.height() - 20
-        zoom_factor = view_height / page_size.height()
 
-        self.pdf_view.setZoomFactor(zoom_factor)
+        self.pdf_view.setZoomFactor(view_height / page_size.height())
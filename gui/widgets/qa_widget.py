@@ -7,22 +7,118 @@ import logging
 
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import (
+    QApplication,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QTextEdit,
+    QPlainTextEdit,
     QLabel,
+    QSizePolicy,
 )
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import Qt, QSize, pyqtSignal, QSignalBlocker, QTimer
 
 logger = logging.getLogger(__name__)
 
+QA_EMIT_DELAY_MS = 150
+POOL_LIMIT = 20  # removed QAItems kept around for reuse
+
+# applied once on QAListWidget; QAItem children are matched by objectName
+_QA_ITEM_QSS = """
+    QAItem, QAItem QWidget {
+        background-color: #1e1e1e;
+        border-radius: 8px;
+    }
+"""
+
+_Q_LABEL_QSS = """
+    QAItem QLabel#questionTag {
+        color: #0366d6;
+        font-weight: bold;
+        font-size: 13px;
+    }
+"""
+
+_A_LABEL_QSS = """
+    QAItem QLabel#answerTag {
+        color: #28a745;
+        font-weight: bold;
+        font-size: 13px;
+    }
+"""
+
+_EDIT_QSS = """
+    QAItem QPlainTextEdit#QAEdit {
+        background-color: #2c2c2c;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        padding: 8px;
+        font-size: 13px;
+    }
+    QAItem QPlainTextEdit#QAEdit:focus {
+        background-color: #3c3c3c;
+    }
+    QAItem QLabel#answerPlaceholder {
+        background-color: #2c2c2c;
+        color: #8e8e8e;
+        border: none;
+        border-radius: 6px;
+        padding: 8px;
+        font-size: 13px;
+    }
+"""
+
+_DEL_BTN_QSS = """
+    QAItem QPushButton#deleteBtn {
+        background-color: transparent;
+        color: #8e8e8e;
+        border: none;
+        font-size: 18px;
+        font-weight: bold;
+        padding: 0px;
+        margin: 0px;
+    }
+    QAItem QPushButton#deleteBtn:hover {
+        color: #ff4444;
+    }
+"""
+
+_QA_LIST_QSS = _QA_ITEM_QSS + _Q_LABEL_QSS + _A_LABEL_QSS + _EDIT_QSS + _DEL_BTN_QSS
+
+
+class _AnswerPlaceholder(QLabel):
+    """Cheap stand-in for an empty answer edit until the user reaches it"""
+
+    activated = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__("Enter answer...", parent)
+        self.setObjectName("answerPlaceholder")
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setMinimumHeight(80)
+
+    def sizeHint(self):  # pylint: disable=invalid-name
+        """Claim the same space as the QPlainTextEdit it stands in for"""
+        return QSize(256, 192)
+
+    def mousePressEvent(self, event):  # pylint: disable=invalid-name
+        """Swap in the real editor on click"""
+        self.activated.emit()
+        event.accept()
+
+    def focusInEvent(self, event):  # pylint: disable=invalid-name
+        """Swap in the real editor when tabbed into"""
+        super().focusInEvent(event)
+        self.activated.emit()
+
 
 class QAItem(QWidget):
     """Widget representing a question and answer pair"""
 
-    deleted = pyqtSignal(QWidget)  # signal sends parameter as itself
+    deleted = pyqtSignal(object)  # signal sends parameter as itself
     qa_changed = pyqtSignal(int, str, str)  # question_id, question, answer
 
     def __init__(self, question_id: int, question: str, answer: str, parent=None):
@@ -30,12 +126,18 @@ class QAItem(QWidget):
         self.question_id = question_id
         self.question = question
         self.answer = answer
-        logger.info(
-            "Creating new QA item - Question ID: %d, Question: %s, Answer: %s",
-            question_id,
-            question[:30] if question else "",
-            answer[:30] if answer else "",
-        )
+        # everything setup_ui and the edit handlers touch exists up front
+        self.question_edit = None
+        self.answer_edit = None
+        self._answer_layout = None
+        self._answer_placeholder = None
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Creating new QA item - Question ID: %d, Question: %s, Answer: %s",
+                question_id,
+                question[:30] if question else "",
+                answer[:30] if answer else "",
+            )
         self.setup_ui()
 
     def setup_ui(self):
@@ -48,52 +150,21 @@ class QAItem(QWidget):
         question_layout.setSpacing(8)
 
         question_label = QLabel("Q:")
-        question_label.setStyleSheet(
-            "color: #0366d6; font-weight: bold; font-size: 13px;"
-        )
+        question_label.setObjectName("questionTag")
         question_layout.addWidget(question_label)
 
-        self.question_edit = QTextEdit()
+        self.question_edit = QPlainTextEdit()
+        self.question_edit.setObjectName("QAEdit")
         self.question_edit.setPlaceholderText("Enter question...")
         self.question_edit.setMaximumHeight(60)
-        self.question_edit.setStyleSheet(
-            """
-            QTextEdit {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 13px;
-            }
-            QTextEdit:focus {
-                background-color: #3c3c3c;
-            }
-        """
-        )
         self.question_edit.setPlainText(self.question)
-        self.question_edit.textChanged.connect(self._handle_text_change)
+        self.question_edit.textChanged.connect(self._on_question_changed)
         question_layout.addWidget(self.question_edit)
 
         delete_button = QPushButton("×")
+        delete_button.setObjectName("deleteBtn")
         delete_button.setFixedSize(24, 24)
         delete_button.clicked.connect(self.delete_qa)
-        delete_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: transparent;
-                color: #8e8e8e;
-                border: none;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 0px;
-                margin: 0px;
-            }
-            QPushButton:hover {
-                color: #ff4444;
-            }
-        """
-        )
         question_layout.addWidget(delete_button)
 
         layout.addLayout(question_layout)
@@ -102,18 +173,18 @@ class QAItem(QWidget):
         answer_layout.setSpacing(8)
 
         answer_label = QLabel("A:")
-        answer_label.setStyleSheet(
-            "color: #28a745; font-weight: bold; font-size: 13px;"
-        )
+        answer_label.setObjectName("answerTag")
         answer_layout.addWidget(answer_label)
 
-        self.answer_edit = QTextEdit()
-        self.answer_edit.setPlaceholderText("Enter answer...")
-        self.answer_edit.setMinimumHeight(80)
-        self.answer_edit.setStyleSheet(self.question_edit.styleSheet())
-        self.answer_edit.setPlainText(self.answer)
-        self.answer_edit.textChanged.connect(self._handle_text_change)
-        answer_layout.addWidget(self.answer_edit)
+        self._answer_layout = answer_layout
+        if self.answer:
+            self.answer_edit = self._create_answer_edit()
+            answer_layout.addWidget(self.answer_edit)
+        else:
+            # the QPlainTextEdit is only built once the answer is actually reached
+            self._answer_placeholder = _AnswerPlaceholder()
+            self._answer_placeholder.activated.connect(self.promote_answer_edit)
+            answer_layout.addWidget(self._answer_placeholder)
 
         spacer = QWidget()
         spacer.setFixedSize(24, 24)
@@ -121,45 +192,70 @@ class QAItem(QWidget):
 
         layout.addLayout(answer_layout)
 
-        self.setStyleSheet(
-            """
-            QWidget {
-                background-color: #1e1e1e;
-                border-radius: 8px;
-            }
-        """
-        )
         logger.debug("QA item UI setup complete")
 
-    def _handle_text_change(self):
-        """Handle text changes in either question or answer"""
-        logger.debug("Text changed in QA item")
-        question = self.question_edit.toPlainText()
-        answer = self.answer_edit.toPlainText()
-        self.question = question
-        self.answer = answer
-        self.qa_changed.emit(self.question_id, question, answer)
+    def _create_answer_edit(self) -> QPlainTextEdit:
+        """Build the answer editor holding the current answer"""
+        answer_edit = QPlainTextEdit()
+        answer_edit.setObjectName("QAEdit")
+        answer_edit.setPlaceholderText("Enter answer...")
+        answer_edit.setMinimumHeight(80)
+        answer_edit.setPlainText(self.answer)
+        answer_edit.textChanged.connect(self._on_answer_changed)
+        return answer_edit
+
+    def promote_answer_edit(self, focus: bool = True) -> QPlainTextEdit:
+        """Replace the answer placeholder with a real QPlainTextEdit"""
+        if self.answer_edit is None:
+            self.answer_edit = self._create_answer_edit()
+            self._answer_layout.replaceWidget(
+                self._answer_placeholder, self.answer_edit
+            )
+            self._answer_placeholder.deleteLater()
+            self._answer_placeholder = None
+            if focus:
+                self.answer_edit.setFocus()
+        return self.answer_edit
+
+    def _on_question_changed(self):
+        """Cache the edited question and report the pair"""
+        self.question = self.question_edit.toPlainText()
+        self.qa_changed.emit(self.question_id, self.question, self.answer)
+
+    def _on_answer_changed(self):
+        """Cache the edited answer and report the pair"""
+        self.answer = self.answer_edit.toPlainText()
+        self.qa_changed.emit(self.question_id, self.question, self.answer)
 
     def get_qa(self):
         """Get the question and answer"""
-        try:
-            q = self.question_edit.toPlainText().strip()
-            a = self.answer_edit.toPlainText().strip()
+        q = self.question.strip()
+        a = self.answer.strip()
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Getting Q&A - ID: %d, Q: %s, A: %s",
                 self.question_id,
                 q[:50] if q else "",
                 a[:50] if a else "",
             )
-            return (self.question_id, str(q), str(a))
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            logger.error("Error getting Q&A: %s", str(e), exc_info=True)
-            return (-1, "", "")
+        return (self.question_id, q, a)
+
+    def rebind(self, question_id: int, question: str, answer: str):
+        """Show a different question-answer pair without rebuilding the widget"""
+        self.question_id = question_id
+        if self.question != question:
+            with QSignalBlocker(self.question_edit):
+                self.question_edit.setPlainText(question)
+            self.question = question
+        if self.answer != answer:
+            answer_edit = self.promote_answer_edit(focus=False)
+            with QSignalBlocker(answer_edit):
+                answer_edit.setPlainText(answer)
+            self.answer = answer
 
     def delete_qa(self):
         """Delete this QA item"""
-        logger.info("Deleting QA item - Q: %s", self.question_edit.toPlainText()[:50])
+        logger.info("Deleting QA item - Q: %s", self.question[:50])
         self.deleted.emit(self)
 
 
@@ -171,6 +267,8 @@ class QAListWidget(QWidget):
     def __init__(self, questions=None, parent=None):
         super().__init__(parent)
         self.questions = questions or []
+        self._items = []
+        self._pool = []
         self.setup_ui()
         self.update_questions(self.questions)
 
@@ -179,123 +277,131 @@ class QAListWidget(QWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(16)
+        self.setStyleSheet(_QA_LIST_QSS)
+
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(QA_EMIT_DELAY_MS)
+        self._emit_timer.timeout.connect(self._flush_qa_change)
         logger.debug("QAListWidget UI setup complete")
 
-    def add_qa_item(self, question_id: int = -1, question: str = "", answer: str = ""):
-        """Add a new Q&A item"""
-        logger.info(
-            "Adding new QA item - ID: %d, Q: %s, A: %s",
-            question_id,
-            question[:50] if question else "empty",
-            answer[:50] if answer else "empty",
-        )
-        item = QAItem(
+    def add_qa_item(
+        self,
+        question_id: int = -1,
+        question: str = "",
+        answer: str = "",
+        index: int = -1,
+    ):
+        """Add a new Q&A item, appended unless an index is given"""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Adding new QA item - ID: %d, Q: %s, A: %s",
+                question_id,
+                question[:50] if question else "empty",
+                answer[:50] if answer else "empty",
+            )
+        item = self.create_qa_item(
             question_id,
             str(question) if question else "",
             str(answer) if answer else "",
         )
+        if index < 0:
+            self._items.append(item)
+        else:
+            self._items.insert(index, item)
+        self.layout.insertWidget(index, item)
+        logger.debug("QA item added at position %d", self.layout.indexOf(item))
+        return item
+
+    def create_qa_item(self, question_id: int, question: str, answer: str) -> QAItem:
+        """Get a connected QA item, reusing a pooled one when available"""
+        if self._pool:
+            item = self._pool.pop()
+            item.rebind(question_id, question, answer)
+            item.show()
+            return item
+
+        item = QAItem(question_id, question, answer)
         item.qa_changed.connect(self.handle_qa_change)
         item.deleted.connect(self.handle_item_deleted)
-        self.layout.addWidget(item)
-        logger.debug("QA item added at position %d", self.layout.count() - 1)
         return item
 
+    def _discard_item(self, item: QAItem):
+        """Take an item out of the list and keep its widget for reuse"""
+        if item in self._items:
+            self._items.remove(item)
+        self.layout.removeWidget(item)
+        item.hide()
+        if len(self._pool) < POOL_LIMIT:
+            self._pool.append(item)
+        else:
+            item.deleteLater()
+
     def handle_item_deleted(self, item: QWidget):
         """Handle item deletion and adjust size"""
         logger.info("Handling item deletion")
-        item.deleteLater()
+        self._discard_item(item)
         self.handle_qa_change()
 
     def get_all_questions(self) -> List[Tuple[int, str, str]]:
         """Get all questions and answers from the list"""
-        try:
-            questions = []
-            count = self.layout.count()
-            logger.debug("Getting questions from %d layout items", count)
+        questions = [
+            (item.question_id, item.question.strip(), item.answer.strip())
+            for item in self._items
+            if item.question.strip() or item.answer.strip()
+        ]
+        logger.info("Got %d questions from QA list", len(questions))
+        return questions
 
-            for i in range(count):
-                item = self.layout.itemAt(i)
-                if not item:
-                    continue
+    def handle_qa_change(self):
+        """Handle any change in the Q&A list, coalescing bursts of edits"""
+        self._emit_timer.start()
 
-                widget = item.widget()
-                logger.debug(
-                    "Checking widget at index %d: %s",
-                    i,
-                    type(widget).__name__ if widget else None,
-                )
-
-                if widget and isinstance(widget, QAItem):
-                    qa_tuple = widget.get_qa()
-                    if qa_tuple[1].strip() or qa_tuple[2].strip():
-                        questions.append(qa_tuple)
-
-            logger.info("Got %d questions from QA list", len(questions))
-            return questions
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            logger.error("Error getting questions: %s", str(e))
-            return []
+    def flush(self):
+        """Emit any pending Q&A change immediately"""
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self._flush_qa_change()
 
-    def handle_qa_change(self):
-        """Handle any change in the Q&A list"""
-        try:
-            logger.debug("Handling QA change")
-            questions = self.get_all_questions()
-            logger.info("Emitting update with %d questions", len(questions))
-            self.qa_updated.emit(questions)
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            logger.error("Error handling QA change: %s", str(e))
+    def _flush_qa_change(self):
+        """Emit the current Q&A list"""
+        questions = self.get_all_questions()
+        logger.info("Emitting update with %d questions", len(questions))
+        self.qa_updated.emit(questions)
 
     def update_questions(self, questions: List[Tuple[int, str, str]]):
         """Update the list of questions"""
         logger.debug("Updating QA list with %d questions", len(questions))
+        # commit edits still waiting on the debounce before their rows are rebound
+        self.flush()
+
+        focus = QApplication.focusWidget()
+        focused_row = next(
+            (i for i, qa_item in enumerate(self._items) if qa_item.isAncestorOf(focus)),
+            -1,
+        )
 
-        focused_widget = None
-        focused_text = None
-        focused_row = -1
-        focused_is_question = False
-
-        for i in range(self.layout.count()):
-            item = self.layout.itemAt(i)
-            if item and item.widget():
-                qa_item = item.widget()
-                if qa_item.question_edit.hasFocus():
-                    focused_widget = qa_item.question_edit
-                    focused_text = focused_widget.toPlainText()
-                    focused_row = i
-                    focused_is_question = True
-                    break
-                elif qa_item.answer_edit.hasFocus():
-                    focused_widget = qa_item.answer_edit
-                    focused_text = focused_widget.toPlainText()
-                    focused_row = i
-                    focused_is_question = False
-                    break
-
-        while self.layout.count():
-            item = self.layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        for question_id, question, answer in questions:
-            self.add_qa_item(question_id, question, answer)
-
-        if focused_widget and focused_row >= 0 and focused_row < self.layout.count():
-            qa_item = self.layout.itemAt(focused_row).widget()
-            if qa_item:
-                if focused_is_question:
-                    qa_item.question_edit.setFocus()
-                    qa_item.question_edit.setPlainText(focused_text)
-                    cursor = qa_item.question_edit.textCursor()
-                    cursor.movePosition(cursor.MoveOperation.End)
-                    qa_item.question_edit.setTextCursor(cursor)
-                else:
-                    qa_item.answer_edit.setFocus()
-                    qa_item.answer_edit.setPlainText(focused_text)
-                    cursor = qa_item.answer_edit.textCursor()
-                    cursor.movePosition(cursor.MoveOperation.End)
-                    qa_item.answer_edit.setTextCursor(cursor)
+        # one layout and paint pass for the whole refresh instead of one per row
+        self.setUpdatesEnabled(False)
+        try:
+            for i, (question_id, question, answer) in enumerate(questions):
+                qa_item = self._items[i] if i < len(self._items) else None
+                if qa_item is not None and qa_item.question_id == question_id:
+                    qa_item.rebind(question_id, question or "", answer or "")
+                    continue
+                if qa_item is not None:
+                    self._discard_item(qa_item)
+                self.add_qa_item(question_id, question, answer, index=i)
+
+            while len(self._items) > len(questions):
+                self._discard_item(self._items[-1])
+        finally:
+            self.setUpdatesEnabled(True)
+            self.layout.activate()
+
+        # a row whose id survives keeps its widget, so focus and caret stay put;
+        # otherwise land on the nearest remaining row without touching its text
+        if focused_row >= 0 and self._items and QApplication.focusWidget() is not focus:
+            self._items[min(focused_row, len(self._items) - 1)].question_edit.setFocus()
 
         logger.debug("QA list updated with %d questions", len(questions))
@@ -6,9 +6,15 @@ import os
 import re
 import logging
 import datetime
+import mmap
 import shutil
-import subprocess
-from typing import List, Tuple
+import string
+import tempfile
+import time
+from contextlib import contextmanager
+from collections import OrderedDict, defaultdict
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import (
@@ -22,14 +28,23 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QGroupBox,
     QFrame,
-    QApplication,
     QTextEdit,
+    QPlainTextEdit,
     QScrollArea,
     QSplitter,
     QGridLayout,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QRect, QObject, QTimer
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QEvent,
+    QLineF,
+    QObject,
+    QProcess,
+    QRect,
+    QTimer,
+)
 from PyQt6.QtGui import (
     QColor,
     QPainter,
@@ -41,6 +56,196 @@ from PyQt6.QtGui import (
 
 logger = logging.getLogger(__name__)
 
+# TemplateItemWidget states are switched through the label's "state" property
+_TEMPLATE_CONTAINER_QSS = """
+    #templateContainer {
+        background-color: transparent;
+    }
+    QLabel#templateName {
+        color: #ffffff;
+        font-size: 13px;
+        background-color: transparent;
+        border-radius: 0px;
+    }
+    QLabel#templateName[state="hover"] {
+        background-color: #3c3c3c;
+    }
+    QLabel#templateName[state="selected"] {
+        background-color: #094771;
+    }
+    QLabel#templateMessage {
+        color: #cccccc;
+        font-size: 13px;
+        padding: 20px;
+    }
+"""
+
+# shared by the search bar and the company/role/date fields
+_INPUT_QSS = """
+    QLineEdit#searchBar, QLineEdit#companyEdit,
+    QLineEdit#roleEdit, QLineEdit#dateEdit {
+        background-color: #2c2c2c;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 12px;
+        font-size: 13px;
+    }
+    QLineEdit#searchBar:focus, QLineEdit#companyEdit:focus,
+    QLineEdit#roleEdit:focus, QLineEdit#dateEdit:focus {
+        background-color: #3c3c3c;
+        outline: none;
+    }
+"""
+
+_PATH_LABEL_QSS = """
+    QLabel#outputPathLabel, QLabel#pdfPathLabel {
+        color: #cccccc;
+        font-size: 13px;
+        background-color: #2c2c2c;
+        border-radius: 4px;
+        padding: 6px;
+    }
+"""
+
+
+_GROUP_DIRS_CACHE = {}  # output path -> (directory mtime_ns, group names)
+
+
+def list_group_dirs(output_path: str) -> List[str]:
+    """Group folders under output_path, re-scanned only when the directory changes"""
+    mtime_ns = os.stat(output_path).st_mtime_ns
+    cached = _GROUP_DIRS_CACHE.get(output_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    with os.scandir(output_path) as entries:
+        groups = [
+            entry.name
+            for entry in entries
+            if entry.is_dir() and entry.name.lower() != "templates"
+        ]
+    _GROUP_DIRS_CACHE[output_path] = (mtime_ns, groups)
+    return groups
+
+
+class _SlugTable(dict):
+    """str.translate table keeping ASCII letters and digits; all else becomes '-'"""
+
+    def __missing__(self, codepoint):
+        self[codepoint] = "-"
+        return "-"
+
+
+_SLUG_TABLE = _SlugTable((c, c) for c in map(ord, string.ascii_letters + string.digits))
+
+
+def _slug(text: str) -> str:
+    """Lowercased text with every character outside [a-zA-Z0-9] replaced by '-'"""
+    return text.lower().strip().translate(_SLUG_TABLE)
+
+
+TEMPLATE_CACHE_MAX_BYTES = 256 * 1024
+PREVIEW_CACHE_SIZE = 32
+SEARCH_CACHE_SIZE = 64
+PDF_EXISTS_TTL = 0.5  # seconds
+PREVIEW_DELAY_MS = 150
+# pdflatex's intermediate files go to tmpfs where there is one
+LATEX_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+RG_MAX_MATCHES = 3
+RG_MAX_FILES = 200  # ripgrep is stopped once this many templates matched
+RG_MAX_COLUMNS = 200
+_CROSS_REF_RE = re.compile(
+    rb"\\(?:ref|pageref|eqref|autoref|cref|cite|bibliography|tableofcontents|listof)"
+)
+_DATE_RE = re.compile(r"\d{8}")  # YYYYMMDD, matched with fullmatch
+_REGEX_META = re.compile(r"[.^$*+?()\[\]{}|\\]")
+_TEMPLATE_TEXT_CACHE = {}  # template path -> (file mtime_ns, contents)
+
+
+def scan_templates(templates_path: str) -> List[Tuple[str, str]]:
+    """(path, contents) for every .tex file below templates_path
+
+    Contents are re-read only when a file's mtime changes; files larger than
+    TEMPLATE_CACHE_MAX_BYTES are listed with None and read on demand.
+    """
+    templates = []
+    pending = [templates_path]
+    while pending:
+        subdirs = []
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".tex") and entry.is_file():
+                    templates.append((entry.path, _cached_template_text(entry)))
+        pending.extend(reversed(subdirs))
+    return templates
+
+
+def _cached_template_text(entry: os.DirEntry):
+    """Contents of a template file, served from cache while it is unchanged"""
+    try:
+        stat = entry.stat()
+    except OSError:
+        return None
+    cached = _TEMPLATE_TEXT_CACHE.get(entry.path)
+    if cached is not None and cached[0] == stat.st_mtime_ns:
+        return cached[1]
+
+    text = None
+    if stat.st_size <= TEMPLATE_CACHE_MAX_BYTES:
+        try:
+            with open(entry.path, "r", encoding="utf-8", errors="ignore") as f:
+                text = f.read()
+        except OSError as e:
+            logger.error("Error reading file %s: %s", entry.path, str(e))
+    _TEMPLATE_TEXT_CACHE[entry.path] = (stat.st_mtime_ns, text)
+    return text
+
+
+def match_lines(buffer, pattern: re.Pattern, newline) -> list:
+    """(line number, line) of the first few lines pattern matches, in one pass
+
+    buffer may be a str or a bytes-like object such as an mmap, with newline
+    of the same type; lines are returned without their line terminator.
+    """
+    carriage_return = b"\r" if isinstance(newline, bytes) else "\r"
+    matches = []
+    line_num = 1
+    scanned = 0
+    last_start = -1
+    for match in pattern.finditer(buffer):
+        start = buffer.rfind(newline, 0, match.start()) + 1
+        if start == last_start:
+            continue
+        line_num += buffer[scanned:start].count(newline)
+        scanned = last_start = start
+        end = buffer.find(newline, match.end())
+        line = buffer[start : end if end != -1 else len(buffer)]
+        matches.append((line_num, line.rstrip(carriage_return)))
+        if len(matches) >= RG_MAX_MATCHES:
+            break
+    return matches
+
+
+def search_large_template(path: str, pattern: re.Pattern) -> List[Tuple[int, str]]:
+    """First few matching lines of an uncached template, scanned in place via mmap"""
+    try:
+        # mmap refuses zero-length files, and an empty template has no matches
+        if os.path.getsize(path) == 0:
+            return []
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            return [
+                (line_num, line.decode("utf-8", errors="ignore"))
+                for line_num, line in match_lines(mm, pattern, b"\n")
+            ]
+    except (OSError, ValueError) as e:
+        logger.error("Error reading file %s: %s", path, str(e))
+        return []
+
 
 class GroupSelector(QFrame):
     """Custom group selector widget similar to ApplicationSelector"""
@@ -49,14 +254,22 @@ class GroupSelector(QFrame):
         str
     )  # Emitted when a group is selected, with the group name
 
+    _ARROW_PEN = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("groupSelector")
         self.current_text = "General"
         self.is_open = False
         self.groups = []
+        self._options_by_text = {}
+        self._closed_by_popup = False
+        self._arrow_up = []
+        self._arrow_down = []
+        self._arrow_rect = QRect()
         # Will be populated in setup_ui
         self.setup_ui()
+        self._layout_arrow()
 
     def setup_ui(self):
         """Setup the selector UI"""
@@ -87,33 +300,6 @@ class GroupSelector(QFrame):
 
         layout.addWidget(self.header)
 
-        self.dropdown = QFrame()
-        self.dropdown.setObjectName("dropdown")
-        self.dropdown.setWindowFlags(
-            Qt.WindowType.Popup
-            | Qt.WindowType.FramelessWindowHint
-            | Qt.WindowType.NoDropShadowWindowHint
-        )
-        self.dropdown.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
-        self.dropdown.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents, False
-        )
-        self.dropdown.setVisible(False)
-
-        QApplication.instance().installEventFilter(self)
-
-        dropdown_layout = QVBoxLayout(self.dropdown)
-        dropdown_layout.setContentsMargins(0, 0, 0, 0)
-        dropdown_layout.setSpacing(0)
-
-        self.options_container = QWidget(self.dropdown)
-        self.options_container.setObjectName("optionsContainer")
-        self.options_layout = QVBoxLayout(self.options_container)
-        self.options_layout.setContentsMargins(0, 4, 0, 4)
-        self.options_layout.setSpacing(0)
-
-        dropdown_layout.addWidget(self.options_container)
-
         self.setStyleSheet(
             """
             #groupSelector {
@@ -134,6 +320,35 @@ class GroupSelector(QFrame):
         """
         )
 
+        # built on first open; most selectors are never expanded
+        self.dropdown = None
+        self.options_container = None
+        self.options_layout = None
+
+    def _ensure_dropdown(self):
+        """Build the dropdown popup and its options the first time it is needed"""
+        if self.dropdown is not None:
+            return
+
+        self.dropdown = QFrame()
+        self.dropdown.setObjectName("dropdown")
+        self.dropdown.setWindowFlags(
+            Qt.WindowType.Popup
+            | Qt.WindowType.FramelessWindowHint
+            | Qt.WindowType.NoDropShadowWindowHint
+        )
+        self.dropdown.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.dropdown.setAttribute(
+            Qt.WidgetAttribute.WA_TransparentForMouseEvents, False
+        )
+        self.dropdown.setVisible(False)
+        # Qt closes the popup on outside clicks; only its hide needs watching
+        self.dropdown.installEventFilter(self)
+
+        dropdown_layout = QVBoxLayout(self.dropdown)
+        dropdown_layout.setContentsMargins(0, 0, 0, 0)
+        dropdown_layout.setSpacing(0)
+
         self.dropdown.setStyleSheet(
             """
             #dropdown {
@@ -165,6 +380,8 @@ class GroupSelector(QFrame):
         """
         )
 
+        self._rebuild_options()
+
     def load_groups(self, output_path):
         """Load groups from output path"""
         self.groups = []
@@ -172,18 +389,10 @@ class GroupSelector(QFrame):
             self.groups.append("General")
 
             if os.path.exists(output_path):
-                for item in os.listdir(output_path):
-                    item_path = os.path.join(output_path, item)
-                    if os.path.isdir(item_path) and item.lower() != "templates":
-                        self.groups.append(item)
-
-            while self.options_layout.count():
-                widget = self.options_layout.takeAt(0).widget()
-                if widget:
-                    widget.deleteLater()
+                self.groups.extend(list_group_dirs(output_path))
 
-            for group in self.groups:
-                self.add_option(group)
+            if self.dropdown is not None:
+                self._rebuild_options()
 
             if self.groups:
                 self.select_option(self.groups[0])
@@ -191,9 +400,37 @@ class GroupSelector(QFrame):
         except Exception as e:
             logger.error("Error loading groups: %s", str(e))
             self.groups = ["General"]
-            self.add_option("General")
+            if self.dropdown is not None:
+                self._rebuild_options()
             self.select_option("General")
 
+    def _rebuild_options(self):
+        """Replace the dropdown options with the current groups"""
+        previous = self.options_container
+
+        # fill a detached container in one go, then swap it in for the old one
+        self.options_container = QWidget(self.dropdown)
+        self.options_container.setObjectName("optionsContainer")
+        self.options_container.setUpdatesEnabled(False)
+        self.options_layout = QVBoxLayout(self.options_container)
+        self.options_layout.setContentsMargins(0, 4, 0, 4)
+        self.options_layout.setSpacing(0)
+        self.options_layout.setEnabled(False)
+        self._options_by_text.clear()
+
+        for group in self.groups:
+            self.add_option(group)
+
+        self.options_layout.setEnabled(True)
+        self.options_container.setUpdatesEnabled(True)
+
+        dropdown_layout = self.dropdown.layout()
+        if previous is None:
+            dropdown_layout.addWidget(self.options_container)
+        else:
+            dropdown_layout.replaceWidget(previous, self.options_container)
+            previous.deleteLater()
+
     def add_option(self, text: str):
         """Add an option to the dropdown"""
         option = QWidget()
@@ -212,6 +449,7 @@ class GroupSelector(QFrame):
         layout.addWidget(label)
 
         self.options_layout.addWidget(option)
+        self._options_by_text[text] = option
 
         def handle_option_click(e):
             if e.button() == Qt.MouseButton.LeftButton:
@@ -225,23 +463,26 @@ class GroupSelector(QFrame):
         if text == self.current_text:
             return
 
+        previous = self._options_by_text.get(self.current_text)
         self.current_text = text
         self.selected_label.setText(text)
 
-        for i in range(self.options_layout.count()):
-            widget = self.options_layout.itemAt(i).widget()
-            if widget:
-                widget_text = widget.objectName().replace("option_", "")
-                widget.setProperty(
-                    "selected", "true" if widget_text == text else "false"
-                )
-                widget.style().unpolish(widget)
+        # only the old and new selection change; polish() alone re-resolves the rules
+        for widget, selected in (
+            (previous, "false"),
+            (self._options_by_text.get(text), "true"),
+        ):
+            if widget is not None:
+                widget.setProperty("selected", selected)
                 widget.style().polish(widget)
+                widget.update()
 
         self.selectionChanged.emit(text)
 
     def toggle_dropdown(self, _event=None):
         """Toggle the dropdown visibility"""
+        if self._closed_by_popup:
+            return
         if self.is_open:
             self.hide_dropdown()
         else:
@@ -250,6 +491,7 @@ class GroupSelector(QFrame):
     def show_dropdown(self):
         """Show the dropdown"""
         if not self.is_open:
+            self._ensure_dropdown()
             pos = self.mapToGlobal(self.rect().bottomLeft())
             content_height = min(300, max(32, self.options_layout.sizeHint().height()))
 
@@ -260,14 +502,14 @@ class GroupSelector(QFrame):
             self.dropdown.show()
             self.dropdown.raise_()
             self.is_open = True
-            self.update()
+            self.update(self._arrow_rect)
 
     def hide_dropdown(self):
         """Hide the dropdown"""
         if self.is_open:
-            self.dropdown.hide()
             self.is_open = False
-            self.update()
+            self.dropdown.hide()
+            self.update(self._arrow_rect)
 
     def paintEvent(self, event):
         """Paint the selector with arrow indicator"""
@@ -275,71 +517,61 @@ class GroupSelector(QFrame):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        arrow_color = QColor("#ffffff")
-        painter.setPen(QPen(arrow_color, 1.5))
+        painter.setPen(self._get_arrow_pen())
+        painter.drawLines(self._arrow_up if self.is_open else self._arrow_down)
+
+    def resizeEvent(self, event):
+        """Recompute the arrow geometry for the new size"""
+        super().resizeEvent(event)
+        self._layout_arrow()
 
+    def _layout_arrow(self):
+        """Cache both arrow shapes so paintEvent only has to pick one"""
         arrow_size = 8
         arrow_x = self.width() - 16
         arrow_y = self.height() // 2
-
-        if self.is_open:
-            painter.drawLine(
-                arrow_x - arrow_size // 2,
-                arrow_y + arrow_size // 4,
-                arrow_x,
-                arrow_y - arrow_size // 4,
-            )
-            painter.drawLine(
-                arrow_x + arrow_size // 2,
-                arrow_y + arrow_size // 4,
-                arrow_x,
-                arrow_y - arrow_size // 4,
-            )
-        else:
-            painter.drawLine(
-                arrow_x - arrow_size // 2,
-                arrow_y - arrow_size // 4,
-                arrow_x,
-                arrow_y + arrow_size // 4,
-            )
-            painter.drawLine(
-                arrow_x + arrow_size // 2,
-                arrow_y - arrow_size // 4,
-                arrow_x,
-                arrow_y + arrow_size // 4,
-            )
+        left = arrow_x - arrow_size // 2
+        right = arrow_x + arrow_size // 2
+        top = arrow_y - arrow_size // 4
+        bottom = arrow_y + arrow_size // 4
+
+        self._arrow_up = [
+            QLineF(left, bottom, arrow_x, top),
+            QLineF(right, bottom, arrow_x, top),
+        ]
+        self._arrow_down = [
+            QLineF(left, top, arrow_x, bottom),
+            QLineF(right, top, arrow_x, bottom),
+        ]
+        # open/close only flips the arrow, so that is all that needs repainting
+        self._arrow_rect = QRect(arrow_x - 8, arrow_y - 8, 16, 16)
+
+    @classmethod
+    def _get_arrow_pen(cls) -> QPen:
+        """Pen for the open/closed arrow, shared by every selector"""
+        if cls._ARROW_PEN is None:
+            cls._ARROW_PEN = QPen(QColor("#ffffff"), 1.5)
+        return cls._ARROW_PEN
 
     def eventFilter(self, obj, event):
-        """Filter global events to close dropdown when clicking outside"""
-        if event.type() == event.Type.MouseButtonPress and self.is_open:
-            dropdown_rect = self.dropdown.geometry()
-
-            header_rect_global = QRect(
-                self.mapToGlobal(self.header.geometry().topLeft()),
-                self.mapToGlobal(self.header.geometry().bottomRight()),
-            )
-
-            global_pos = event.globalPosition().toPoint()
-            if not dropdown_rect.contains(
-                global_pos
-            ) and not header_rect_global.contains(global_pos):
-                self.hide_dropdown()
-
+        """Notice the popup closing itself on a click outside of it"""
+        if obj is self.dropdown and event.type() == QEvent.Type.Hide and self.is_open:
+            self.is_open = False
+            self.update(self._arrow_rect)
+            # that same click may be replayed onto the header; don't reopen on it
+            self._closed_by_popup = True
+            QTimer.singleShot(0, self._end_popup_close)
         return super().eventFilter(obj, event)
 
+    def _end_popup_close(self):
+        """Accept header clicks again once the closing click has been handled"""
+        self._closed_by_popup = False
+
     def hideEvent(self, event):
         """Handle widget being hidden"""
         self.hide_dropdown()
         super().hideEvent(event)
 
-    def __del__(self):
-        """Clean up event filter"""
-        try:
-            QApplication.instance().removeEventFilter(self)
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            logger.debug("Failed to remove event filter: %s", str(e))
-
 
 class DraggableDialog(QDialog):
     """Base class for frameless, draggable dialogs"""
@@ -385,6 +617,7 @@ class TemplateItemWidget(QWidget):
         self.template_path = template_path
         self.match_lines = match_lines or []
         self.is_selected = False
+        self._state = "default"
         self.setup_ui()
 
     def setup_ui(self):
@@ -395,74 +628,37 @@ class TemplateItemWidget(QWidget):
 
         filename = os.path.basename(self.template_path)
         self.name_label = QLabel(filename)
-        self.name_label.setStyleSheet(
-            """
-            QLabel {
-                color: #ffffff;
-                font-size: 13px;
-            }
-        """
-        )
+        self.name_label.setObjectName("templateName")
+        self.name_label.setProperty("state", self._state)
         layout.addWidget(self.name_label)
 
-        self.setStyleSheet(
-            """
-            QWidget {
-                background-color: transparent;
-                border-radius: 0px;
-            }
-        """
-        )
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setFixedHeight(24)
 
+    def _set_state(self, state: str):
+        """Restyle the item for default/hover/selected, only when it changes"""
+        if state == self._state:
+            return
+        self._state = state
+        self.name_label.setProperty("state", state)
+        self.name_label.style().polish(self.name_label)
+
     def set_selected(self, selected: bool):
         """Set the selected state of this item"""
         self.is_selected = selected
-        if selected:
-            self.setStyleSheet(
-                """
-                QWidget {
-                    background-color: #094771;
-                    border-radius: 0px;
-                }
-            """
-            )
-        else:
-            self.setStyleSheet(
-                """
-                QWidget {
-                    background-color: transparent;
-                    border-radius: 0px;
-                }
-            """
-            )
+        self._set_state("selected" if selected else "default")
 
     def enterEvent(self, event):
         """Handle mouse enter to emit focused signal"""
         if not self.is_selected:
-            self.setStyleSheet(
-                """
-                QWidget {
-                    background-color: #3c3c3c;
-                    border-radius: 0px;
-                }
-            """
-            )
+            self._set_state("hover")
         self.focused.emit(self.template_path)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         """Handle mouse leave to reset styling"""
         if not self.is_selected:
-            self.setStyleSheet(
-                """
-                QWidget {
-                    background-color: transparent;
-                    border-radius: 0px;
-                }
-            """
-            )
+            self._set_state("default")
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
@@ -476,11 +672,15 @@ class TemplateItemWidget(QWidget):
 class FilePreviewWidget(QWidget):
     """Widget for displaying a preview of a file with context around matched lines"""
 
+    _HIGHLIGHT_FORMAT = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_file = None
         self.match_lines = []
         self.context_lines = 5
+        # (path, mtime_ns, match line numbers) -> (text, highlighted blocks)
+        self._preview_cache = OrderedDict()
         self.setup_ui()
 
     def setup_ui(self):
@@ -504,12 +704,12 @@ class FilePreviewWidget(QWidget):
         )
         layout.addWidget(self.header_label)
 
-        self.preview_text = QTextEdit()
+        self.preview_text = QPlainTextEdit()
         self.preview_text.setReadOnly(True)
-        self.preview_text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.preview_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.preview_text.setStyleSheet(
             """
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1c1c1c;
                 color: #cccccc;
                 border: none;
@@ -567,7 +767,16 @@ class FilePreviewWidget(QWidget):
         )
         layout.addWidget(self.preview_text)
 
-        self.preview_text.setText("Select a template file to see a preview")
+        self.preview_text.setPlainText("Select a template file to see a preview")
+
+    @classmethod
+    def _get_highlight_format(cls) -> QTextCharFormat:
+        """Format for matched lines, shared by every preview"""
+        if cls._HIGHLIGHT_FORMAT is None:
+            cls._HIGHLIGHT_FORMAT = QTextCharFormat()
+            cls._HIGHLIGHT_FORMAT.setBackground(QColor("#2f4f6f"))
+            cls._HIGHLIGHT_FORMAT.setForeground(QColor("#ffffff"))
+        return cls._HIGHLIGHT_FORMAT
 
     def load_file_preview(
         self, file_path: str, match_lines: List[Tuple[int, str]] = None
@@ -575,79 +784,106 @@ class FilePreviewWidget(QWidget):
         """Load a file preview with context around matched lines"""
         self.current_file = file_path
         self.match_lines = match_lines or []
+        self.preview_text.setExtraSelections([])
 
-        if not file_path or not os.path.exists(file_path):
-            self.preview_text.setText("File not found")
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns if file_path else None
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is None:
+            self.preview_text.setPlainText("File not found")
             return
 
+        # one relayout and repaint once the text and highlights are in place
+        self.preview_text.setUpdatesEnabled(False)
         try:
             filename = os.path.basename(file_path)
             self.header_label.setText(f"Preview: {filename}")
 
-            if not self.match_lines:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = f.readlines()
-                    preview_text = "".join(lines[:20])
-                    self.preview_text.setText(preview_text)
-                return
+            key = (file_path, mtime_ns, tuple(m[0] for m in self.match_lines))
+            preview = self._preview_cache.get(key)
+            if preview is None:
+                preview = self._build_preview(file_path)
+                self._preview_cache[key] = preview
+                if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
+            else:
+                self._preview_cache.move_to_end(key)
 
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
+            text, match_blocks = preview
+            self.preview_text.setPlainText(text)
 
-            preview_text = ""
-            processed_line_nums = set()
+            text_format = self._get_highlight_format()
+            doc = self.preview_text.document()
+            selections = []
+            for block_num in match_blocks:
+                cursor = QTextCursor(doc.findBlockByNumber(block_num))
+                cursor.movePosition(
+                    QTextCursor.MoveOperation.EndOfBlock,
+                    QTextCursor.MoveMode.KeepAnchor,
+                )
+                selection = QTextEdit.ExtraSelection()
+                selection.cursor = cursor
+                selection.format = text_format
+                selections.append(selection)
+            self.preview_text.setExtraSelections(selections)
 
-            for line_num, _ in sorted(self.match_lines):
-                if line_num in processed_line_nums:
-                    continue
+            cursor = self.preview_text.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.Start)
+            self.preview_text.setTextCursor(cursor)
 
-                start_line = max(0, line_num - self.context_lines - 1)
-                end_line = min(len(lines), line_num + self.context_lines)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            logger.error("Error loading file preview: %s", str(e))
+            self.preview_text.setPlainText(f"Error loading preview: {str(e)}")
+        finally:
+            self.preview_text.setUpdatesEnabled(True)
 
-                if preview_text:
-                    preview_text += "\n\n...\n\n"
+    def _build_preview(self, file_path: str) -> Tuple[str, List[int]]:
+        """Preview text for the current matches, plus the blocks to highlight"""
+        if not self.match_lines:
+            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                return "".join(islice(f, 20)), []
 
-                preview_text += f"--- Lines {start_line+1}-{end_line} ---\n"
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            lines = f.readlines()
 
-                for i in range(start_line, end_line):
-                    is_match = any(m[0] == i + 1 for m in self.match_lines)
-                    line_prefix = f"{i+1:4d}: "
+        parts: List[str] = []
+        processed_line_nums = set()
+        context_lines = self.context_lines
+        line_count = len(lines)
+        match_set = {m[0] for m in self.match_lines}
+        # document block (line) index of every highlighted match line
+        match_blocks = []
+        block = 0
 
-                    if is_match:
-                        preview_text += f"→ {line_prefix}{lines[i]}"
-                    else:
-                        preview_text += f"  {line_prefix}{lines[i]}"
+        for line_num, _ in sorted(self.match_lines):
+            if line_num in processed_line_nums:
+                continue
 
-                    processed_line_nums.add(i + 1)
+            start_line = max(0, line_num - context_lines - 1)
+            end_line = min(line_count, line_num + context_lines)
 
-            self.preview_text.setText(preview_text)
+            if parts:
+                parts.append("\n\n...\n\n")
+                block += 4
 
-            doc = self.preview_text.document()
-            cursor = QTextCursor(doc)
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
+            parts.append(f"--- Lines {start_line+1}-{end_line} ---\n")
+            block += 1
 
-            text_format = QTextCharFormat()
-            text_format.setBackground(QColor("#2f4f6f"))
-            text_format.setForeground(QColor("#ffffff"))
+            for i in range(start_line, end_line):
+                line_prefix = f"{i+1:4d}: "
 
-            while not cursor.atEnd():
-                cursor.select(QTextCursor.SelectionType.LineUnderCursor)
-                line_text = cursor.selectedText()
+                if i + 1 in match_set:
+                    match_blocks.append(block)
+                    parts.append(f"→ {line_prefix}{lines[i]}")
+                else:
+                    parts.append(f"  {line_prefix}{lines[i]}")
+                block += lines[i].count("\n")
 
-                if line_text.startswith("→"):
-                    cursor.setCharFormat(text_format)
+                processed_line_nums.add(i + 1)
 
-                cursor.movePosition(QTextCursor.MoveOperation.Down)
-                cursor.movePosition(QTextCursor.MoveOperation.StartOfLine)
-
-            cursor = self.preview_text.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            self.preview_text.setTextCursor(cursor)
-
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            logger.error("Error loading file preview: %s", str(e))
-            self.preview_text.setText(f"Error loading preview: {str(e)}")
+        return "".join(parts), match_blocks
 
 
 class DebounceTimer(QObject):
@@ -658,14 +894,24 @@ class DebounceTimer(QObject):
     def __init__(self, interval=300, parent=None):
         super().__init__(parent)
         self.interval = interval
+        self._deadline = 0.0
         self.timer = QTimer(self)
         self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self.timeout.emit)
+        self.timer.timeout.connect(self._check)
 
     def start(self):
-        """Start or restart the timer"""
-        self.timer.stop()
-        self.timer.start(self.interval)
+        """Push the deadline back, arming the timer only if it is idle"""
+        self._deadline = time.monotonic() + self.interval / 1000
+        if not self.timer.isActive():
+            self.timer.start(self.interval)
+
+    def _check(self):
+        """Fire once the deadline has passed, otherwise wait out the rest"""
+        remaining = self._deadline - time.monotonic()
+        if remaining > 0:
+            self.timer.start(max(1, int(remaining * 1000)))
+        else:
+            self.timeout.emit()
 
 
 class ResumeCreationDialog(DraggableDialog):
@@ -682,9 +928,26 @@ class ResumeCreationDialog(DraggableDialog):
         self.role = role
         self.date = datetime.datetime.now().strftime("%Y%m%d")
         self.template_items = []
+        self._template_cache: List[Tuple[str, str]] = []
         self.debounce_timer = DebounceTimer(300, self)
         self.debounce_timer.timeout.connect(self._perform_search)
         self.current_search = ""
+        self._rg_path = shutil.which("rg")
+        self._rg_process: Optional[QProcess] = None
+        self._rg_query = ""
+        self._rg_key = None
+        self._rg_buffer = b""
+        self._rg_matches = defaultdict(list)
+        # (query, templates dir mtime_ns) -> matching files, least recent first
+        self._search_cache = OrderedDict()
+        self._latex_process: Optional[QProcess] = None
+        self._latex_build_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._exists_cache: Dict[str, Tuple[float, bool]] = {}
+        # typing in the detail fields refreshes the preview once it pauses
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DELAY_MS)
+        self._preview_timer.timeout.connect(self.update_preview)
         self.setup_ui()
         self.load_templates()
 
@@ -705,6 +968,8 @@ class ResumeCreationDialog(DraggableDialog):
                 border-radius: 12px;
             }
         """
+            + _INPUT_QSS
+            + _PATH_LABEL_QSS
         )
 
         layout = QVBoxLayout(container)
@@ -751,23 +1016,8 @@ class ResumeCreationDialog(DraggableDialog):
 
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search templates...")
+        self.search_bar.setObjectName("searchBar")
         self.search_bar.textChanged.connect(self.debounce_search)
-        self.search_bar.setStyleSheet(
-            """
-            QLineEdit {
-                background-color: #2c2c2c;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                background-color: #3c3c3c;
-                outline: none;
-            }
-        """
-        )
         search_layout.addWidget(self.search_bar)
         template_layout.addLayout(search_layout)
 
@@ -833,13 +1083,7 @@ class ResumeCreationDialog(DraggableDialog):
 
         self.template_container = QWidget()
         self.template_container.setObjectName("templateContainer")
-        self.template_container.setStyleSheet(
-            """
-            #templateContainer {
-                background-color: transparent;
-            }
-        """
-        )
+        self.template_container.setStyleSheet(_TEMPLATE_CONTAINER_QSS)
 
         self.template_layout = QVBoxLayout(self.template_container)
         self.template_layout.setContentsMargins(4, 4, 4, 4)
@@ -901,10 +1145,10 @@ class ResumeCreationDialog(DraggableDialog):
         )
 
         self.company_edit = QLineEdit()
+        self.company_edit.setObjectName("companyEdit")
         self.company_edit.setText(self.company)
         self.company_edit.setPlaceholderText("Company name...")
-        self.company_edit.setStyleSheet(self.search_bar.styleSheet())
-        self.company_edit.textChanged.connect(self.update_preview)
+        self.company_edit.textChanged.connect(self._preview_timer.start)
         self.company_edit.setMinimumWidth(300)
 
         details_layout.addWidget(company_label, 1, 0)
@@ -917,10 +1161,10 @@ class ResumeCreationDialog(DraggableDialog):
         )
 
         self.role_edit = QLineEdit()
+        self.role_edit.setObjectName("roleEdit")
         self.role_edit.setText(self.role)
         self.role_edit.setPlaceholderText("Job role...")
-        self.role_edit.setStyleSheet(self.search_bar.styleSheet())
-        self.role_edit.textChanged.connect(self.update_preview)
+        self.role_edit.textChanged.connect(self._preview_timer.start)
         self.role_edit.setMinimumWidth(300)
 
         details_layout.addWidget(role_label, 2, 0)
@@ -933,10 +1177,10 @@ class ResumeCreationDialog(DraggableDialog):
         )
 
         self.date_edit = QLineEdit()
+        self.date_edit.setObjectName("dateEdit")
         self.date_edit.setText(self.date)
         self.date_edit.setPlaceholderText("YYYYMMDD")
-        self.date_edit.setStyleSheet(self.search_bar.styleSheet())
-        self.date_edit.textChanged.connect(self.update_preview)
+        self.date_edit.textChanged.connect(self._preview_timer.start)
         self.date_edit.setMinimumWidth(300)
 
         details_layout.addWidget(date_label, 3, 0)
@@ -955,23 +1199,13 @@ class ResumeCreationDialog(DraggableDialog):
         preview_container_layout.setSpacing(4)
 
         self.output_path_label = QLabel()
+        self.output_path_label.setObjectName("outputPathLabel")
         self.output_path_label.setWordWrap(True)
-        self.output_path_label.setStyleSheet(
-            """
-            QLabel {
-                color: #cccccc;
-                font-size: 13px;
-                background-color: #2c2c2c;
-                border-radius: 4px;
-                padding: 6px;
-            }
-        """
-        )
         preview_container_layout.addWidget(self.output_path_label)
 
         self.pdf_path_label = QLabel()
+        self.pdf_path_label.setObjectName("pdfPathLabel")
         self.pdf_path_label.setWordWrap(True)
-        self.pdf_path_label.setStyleSheet(self.output_path_label.styleSheet())
         preview_container_layout.addWidget(self.pdf_path_label)
 
         details_layout.addWidget(preview_label, 4, 0, Qt.AlignmentFlag.AlignTop)
@@ -1043,6 +1277,11 @@ class ResumeCreationDialog(DraggableDialog):
 
     def load_templates(self):
         """Load resume templates"""
+        with self._batched_template_updates():
+            self._load_templates()
+
+    def _load_templates(self):
+        """Rebuild the template list from a fresh scan of templates_path"""
         self.clear_templates()
 
         if not os.path.exists(self.templates_path):
@@ -1052,45 +1291,49 @@ class ResumeCreationDialog(DraggableDialog):
             )
             return
 
-        tex_files = []
-        for root, _, files in os.walk(self.templates_path):
-            for file in files:
-                if file.endswith(".tex"):
-                    tex_files.append(os.path.join(root, file))
+        templates = scan_templates(self.templates_path)
+        if templates != self._template_cache:
+            # a template was added, removed or edited; earlier results are stale
+            self._search_cache.clear()
+        self._template_cache = templates
 
-        if not tex_files:
+        if not self._template_cache:
             self.add_message_item(
                 "No templates found. Please add .tex files to templates directory."
             )
             return
 
-        for tex_file in tex_files:
-            self.add_template_item(tex_file)
+        self.add_template_items((tex_file, None) for tex_file, _ in templates)
 
-    def add_template_item(
-        self, template_path: str, match_lines: List[Tuple[int, str]] = None
+    def add_template_items(
+        self, entries: Iterable[Tuple[str, Optional[List[Tuple[int, str]]]]]
     ):
-        """Add a template item to the container"""
-        item = TemplateItemWidget(template_path, match_lines)
-        item.clicked.connect(self.handle_template_selected)
-        item.focused.connect(self.handle_template_focused)
-
-        self.template_layout.insertWidget(self.template_layout.count() - 1, item)
-        self.template_items.append(item)
+        """Add a template item to the container for each (path, match lines)"""
+        items = [TemplateItemWidget(path, lines) for path, lines in entries]
+        # everything goes in ahead of the trailing stretch
+        index = self.template_layout.count() - 1
+        for item in items:
+            item.clicked.connect(self.handle_template_selected)
+            item.focused.connect(self.handle_template_focused)
+            self.template_layout.insertWidget(index, item)
+            index += 1
+        self.template_items.extend(items)
+
+    @contextmanager
+    def _batched_template_updates(self):
+        """Repaint and relayout the template list once for the whole block"""
+        self.template_container.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.template_container.setUpdatesEnabled(True)
+            self.template_container.updateGeometry()
 
     def add_message_item(self, message: str):
         """Add a message item to the container"""
         message_label = QLabel(message)
+        message_label.setObjectName("templateMessage")
         message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        message_label.setStyleSheet(
-            """
-            QLabel {
-                color: #cccccc;
-                font-size: 13px;
-                padding: 20px;
-            }
-        """
-        )
 
         self.template_layout.insertWidget(
             self.template_layout.count() - 1, message_label
@@ -1117,123 +1360,190 @@ class ResumeCreationDialog(DraggableDialog):
 
     def filter_templates(self, search_text: str):
         """Filter templates using ripgrep-like search"""
+        self._cancel_search()
+
         if not search_text:
             self.load_templates()
             return
 
-        self.clear_templates()
-
         try:
-            loading_label = QLabel("Searching...")
-            loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            loading_label.setStyleSheet(
-                """
-                QLabel {
-                    color: #cccccc;
-                    font-size: 13px;
-                    padding: 20px;
-                }
-            """
-            )
-            self.template_layout.insertWidget(
-                self.template_layout.count() - 1, loading_label
-            )
+            mtime_ns = os.stat(self.templates_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        key = (search_text, mtime_ns)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            self._show_search_results(search_text, cached)
+            return
 
-            QApplication.processEvents()
-
-            matching_files = {}
-
-            try:
-                process = subprocess.run(
-                    [
-                        "rg",
-                        "--follow",
-                        "--hidden",
-                        "--no-heading",
-                        "--with-filename",
-                        "--line-number",
-                        "--column",
-                        "--smart-case",
-                        "--no-ignore-vcs",
-                        "--no-ignore-global",
-                        "-t",
-                        "tex",
-                        search_text,
-                        self.templates_path,
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+        if self._rg_path is None:
+            matching_files = self._fallback_search(search_text)
+            self._remember_search(key, matching_files)
+            self._show_search_results(search_text, matching_files)
+            return
+
+        rg_args = [
+            "--follow",
+            "--hidden",
+            "--no-heading",
+            "--with-filename",
+            "--line-number",
+            "--column",
+            "--smart-case",
+            "--no-ignore-vcs",
+            "--no-ignore-global",
+            # only the first few matches per file are ever shown
+            f"--max-count={RG_MAX_MATCHES}",
+            f"--max-columns={RG_MAX_COLUMNS}",
+            "-t",
+            "tex",
+        ]
+        if not _REGEX_META.search(search_text):
+            rg_args.append("--fixed-strings")
+        rg_args += ["-e", search_text, self.templates_path]
+
+        # results replace the current list once ripgrep exits; the UI keeps running
+        process = QProcess(self)
+        self._rg_process = process
+        self._rg_query = search_text
+        self._rg_key = key
+        self._rg_buffer = b""
+        self._rg_matches = defaultdict(list)
+        process.readyReadStandardOutput.connect(lambda: self._read_rg_output(process))
+        process.finished.connect(
+            lambda exit_code, _status: self._finish_rg_search(process, exit_code)
+        )
+        process.errorOccurred.connect(
+            lambda error: self._handle_rg_error(process, error)
+        )
+        process.start(self._rg_path, rg_args)
+
+    def _cancel_search(self):
+        """Kill the ripgrep run of a query that has been superseded"""
+        process = self._rg_process
+        if process is None:
+            return
+        self._rg_process = None
+        process.readyReadStandardOutput.disconnect()
+        process.finished.disconnect()
+        process.errorOccurred.disconnect()
+        if process.state() != QProcess.ProcessState.NotRunning:
+            process.finished.connect(process.deleteLater)
+            process.kill()
+        else:
+            process.deleteLater()
+
+    def _read_rg_output(self, process: QProcess):
+        """Parse the complete lines ripgrep has written so far"""
+        if process is not self._rg_process:
+            return
+        *lines, self._rg_buffer = (
+            self._rg_buffer + bytes(process.readAllStandardOutput())
+        ).split(b"\n")
+        self._parse_rg_lines(lines)
+
+        if len(self._rg_matches) >= RG_MAX_FILES:
+            # the list is full; stop ripgrep rather than wait for the rest
+            self._cancel_search()
+            matching_files = dict(islice(self._rg_matches.items(), RG_MAX_FILES))
+            self._remember_search(self._rg_key, matching_files)
+            self._show_search_results(self._rg_query, matching_files)
+
+    def _parse_rg_lines(self, lines: List[bytes]):
+        """Group ripgrep's path:line:column:text lines by file"""
+        matching_files = self._rg_matches
+        for raw in lines:
+            if not raw:
+                continue
+            line = raw.decode("utf-8", errors="replace")
+            file_path, _, rest = line.partition(":")
+            line_num, sep, line_text = rest.partition(":")
+            if sep:
+                matching_files[file_path].append((int(line_num), line_text))
+
+    def _finish_rg_search(self, process: QProcess, exit_code: int):
+        """Show the results of a ripgrep run that was not superseded"""
+        if process is not self._rg_process:
+            return
+        self._read_rg_output(process)
+        if process is not self._rg_process:
+            return  # the result limit was reached on the final read
+        self._parse_rg_lines([self._rg_buffer])
+        self._rg_process = None
+        process.deleteLater()
+
+        # ripgrep exits with 1 when nothing matched and 2 on errors
+        if exit_code > 1:
+            logger.error(
+                "Ripgrep failed: %s",
+                bytes(process.readAllStandardError()).decode(errors="replace"),
+            )
+        else:
+            self._remember_search(self._rg_key, self._rg_matches)
+        self._show_search_results(self._rg_query, self._rg_matches)
 
-                if process.returncode == 0 and process.stdout:
-                    for line in process.stdout.splitlines():
-                        parts = line.split(":", 2)
-                        if len(parts) >= 3:
-                            file_path = parts[0]
-                            line_num = int(parts[1])
-                            line_text = parts[2]
-
-                            if file_path not in matching_files:
-                                matching_files[file_path] = []
-
-                            matching_files[file_path].append((line_num, line_text))
-
-            except FileNotFoundError:
-                logger.warning("Ripgrep not found, using fallback search method")
-
-                for root, _, files in os.walk(self.templates_path):
-                    for file in files:
-                        if file.endswith(".tex"):
-                            full_path = os.path.join(root, file)
-
-                            if search_text.lower() in file.lower():
-                                matching_files[full_path] = []
-                                continue
-
-                            try:
-                                with open(
-                                    full_path, "r", encoding="utf-8", errors="ignore"
-                                ) as f:
-                                    content = f.read().lower()
-                                    if search_text.lower() in content:
-                                        with open(
-                                            full_path,
-                                            "r",
-                                            encoding="utf-8",
-                                            errors="ignore",
-                                        ) as f2:
-                                            lines = f2.readlines()
-                                            matches = []
-                                            for i, line in enumerate(lines):
-                                                if search_text.lower() in line.lower():
-                                                    matches.append((i + 1, line))
-                                                    if len(matches) >= 3:
-                                                        break
-
-                                        matching_files[full_path] = matches
-                            # pylint: disable=broad-exception-caught
-                            except Exception as e:
-                                logger.error(
-                                    "Error reading file %s: %s", full_path, str(e)
-                                )
-
-            if self.template_layout.count() > 1:
-                item = self.template_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-
-            for file_path, matches in matching_files.items():
-                self.add_template_item(file_path, matches)
+    def _remember_search(
+        self,
+        key: Tuple[str, Optional[int]],
+        matching_files: Dict[str, List[Tuple[int, str]]],
+    ):
+        """Keep the results of a query for when it is typed again"""
+        self._search_cache[key] = matching_files
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+
+    def _handle_rg_error(self, process: QProcess, error: QProcess.ProcessError):
+        """Fall back to the in-memory search when ripgrep cannot be started"""
+        if (
+            process is not self._rg_process
+            or error != QProcess.ProcessError.FailedToStart
+        ):
+            return
+        logger.warning("Ripgrep not found, using fallback search method")
+        self._rg_path = None
+        self._rg_process = None
+        process.deleteLater()
+        matching_files = self._fallback_search(self._rg_query)
+        self._remember_search(self._rg_key, matching_files)
+        self._show_search_results(self._rg_query, matching_files)
+
+    def _fallback_search(self, search_text: str) -> Dict[str, List[Tuple[int, str]]]:
+        """Search the cached template contents when ripgrep is unavailable"""
+        matching_files = {}
+        pattern = re.compile(re.escape(search_text), re.IGNORECASE)
+        byte_pattern = None  # only needed for templates too large to cache
+        for full_path, content in self._template_cache:
+            if pattern.search(os.path.basename(full_path)):
+                matching_files[full_path] = []
+                continue
+
+            if content is None:
+                if byte_pattern is None:
+                    byte_pattern = re.compile(
+                        re.escape(search_text.encode("utf-8")), re.IGNORECASE
+                    )
+                matches = search_large_template(full_path, byte_pattern)
+                if matches:
+                    matching_files[full_path] = matches
+                continue
+
+            matches = match_lines(content, pattern, "\n")
+            if matches:
+                matching_files[full_path] = matches
+        return matching_files
+
+    def _show_search_results(
+        self, search_text: str, matching_files: Dict[str, List[Tuple[int, str]]]
+    ):
+        """Replace the template list with the files that matched"""
+        with self._batched_template_updates():
+            self.clear_templates()
+            self.add_template_items(matching_files.items())
 
             if not matching_files:
                 self.add_message_item(f"No matches found for '{search_text}'")
 
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            logger.error("Error filtering templates: %s", str(e))
-            self.add_message_item(f"Error searching templates: {str(e)}")
-
     def handle_template_focused(self, template_path: str):
         """Handle when a template is focused/hovered"""
         match_lines = []
@@ -1249,6 +1559,7 @@ class ResumeCreationDialog(DraggableDialog):
         self.selected_template = template_path
         self.selection_label.setText(f"Selected: {os.path.basename(template_path)}")
 
+        self.flush_preview()
         self.create_button.setEnabled(self.is_form_valid())
 
         for item in self.template_items:
@@ -1256,6 +1567,12 @@ class ResumeCreationDialog(DraggableDialog):
 
         self.handle_template_focused(template_path)
 
+    def flush_preview(self):
+        """Apply a pending debounced preview update right away"""
+        if self._preview_timer.isActive():
+            self._preview_timer.stop()
+            self.update_preview()
+
     def update_preview(self):
         """Update the preview label based on current input"""
         self.company = self.company_edit.text()
@@ -1269,10 +1586,10 @@ class ResumeCreationDialog(DraggableDialog):
             self.create_button.setText("Create Resume")
             return
 
-        company = re.sub(r"[^a-zA-Z0-9]", "-", self.company.lower().strip())
-        role = re.sub(r"[^a-zA-Z0-9]", "-", self.role.lower().strip())
+        company = _slug(self.company)
+        role = _slug(self.role)
 
-        date_valid = re.match(r"^\d{8}$", self.date) is not None
+        date_valid = _DATE_RE.fullmatch(self.date) is not None
         if not date_valid:
             self.date = datetime.datetime.now().strftime("%Y%m%d")
             self.date_edit.setText(self.date)
@@ -1288,8 +1605,11 @@ class ResumeCreationDialog(DraggableDialog):
         self.output_path_label.setText(f"Resume will be saved as:\n{tex_path}")
         self.pdf_path_label.setText(f"PDF will be generated as:\n{pdf_path}")
 
+        if self._latex_process is not None:
+            return  # the button reflects the running compilation until it ends
+
         form_valid = self.is_form_valid()
-        pdf_exists = os.path.exists(pdf_path)
+        pdf_exists = self._pdf_exists(pdf_path)
 
         if pdf_exists:
             self.create_button.setEnabled(False)
@@ -1302,23 +1622,35 @@ class ResumeCreationDialog(DraggableDialog):
             self.create_button.setEnabled(form_valid)
             self.create_button.setText("Create Resume")
 
+    def _pdf_exists(self, pdf_path: str) -> bool:
+        """os.path.exists, remembered briefly so typing does not stat every key"""
+        now = time.monotonic()
+        cached = self._exists_cache.get(pdf_path)
+        if cached is not None and now - cached[0] < PDF_EXISTS_TTL:
+            return cached[1]
+        exists = os.path.exists(pdf_path)
+        self._exists_cache[pdf_path] = (now, exists)
+        return exists
+
     def is_form_valid(self) -> bool:
         """Check if the form is valid for resume creation"""
         return (
             self.selected_template is not None
+            and self._latex_process is None
             and self.company.strip() != ""
             and self.role.strip() != ""
-            and re.match(r"^\d{8}$", self.date) is not None
+            and _DATE_RE.fullmatch(self.date) is not None
         )
 
     def create_resume(self):
         """Create resume from selected template"""
+        self.flush_preview()
         if not self.is_form_valid():
             return
 
         try:
-            company = re.sub(r"[^a-zA-Z0-9]", "-", self.company.lower().strip())
-            role = re.sub(r"[^a-zA-Z0-9]", "-", self.role.lower().strip())
+            company = _slug(self.company)
+            role = _slug(self.role)
             group = self.group_selector.current_text.lower().replace(" ", "_")
 
             dir_name = f"{company}_{role}_{self.date}"
@@ -1350,58 +1682,138 @@ class ResumeCreationDialog(DraggableDialog):
                 "Copied template from %s to %s", self.selected_template, tex_path
             )
 
-            logger.info("Running pdflatex on %s", tex_path)
-
-            original_dir = os.getcwd()
-            os.chdir(output_dir)
+            # a second pass only matters when something refers back to the .aux
+            with open(tex_path, "rb") as f:
+                passes = 2 if _CROSS_REF_RE.search(f.read()) else 1
 
-            try:
-                for _ in range(2):
-                    process = subprocess.run(
-                        ["pdflatex", "-interaction=nonstopmode", f"{file_name}.tex"],
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
+            logger.info("Running pdflatex on %s (%d passes)", tex_path, passes)
+            # aux/log/out churn goes to scratch space; only the PDF is moved back
+            self._latex_build_dir = tempfile.TemporaryDirectory(
+                prefix="pdflatex_", dir=LATEX_SCRATCH_DIR, ignore_cleanup_errors=True
+            )
+            self._start_pdflatex(output_dir, file_name, pdf_path, passes=passes)
 
-                    if process.returncode != 0:
-                        logger.error("pdflatex error: %s", process.stderr)
-                        # pylint: disable=broad-exception-raised
-                        raise Exception(
-                            f"PDF generation failed. Error: {process.stderr}"
-                        )
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            logger.error("Error creating resume: %s", str(e))
+            QMessageBox.critical(
+                self, "Error Creating Resume", f"Failed to create resume: {str(e)}"
+            )
 
-                if not os.path.exists(pdf_path):
-                    # pylint: disable=broad-exception-raised
-                    raise Exception("PDF file was not created")
+    def _start_pdflatex(
+        self, output_dir: str, file_name: str, pdf_path: str, passes: int
+    ):
+        """Compile the copied template in the background, one pass at a time"""
+        process = QProcess(self)
+        process.setWorkingDirectory(output_dir)
+        process.setProgram("pdflatex")
+        arguments = [
+            "-interaction=nonstopmode",
+            "-halt-on-error",
+            f"-output-directory={self._latex_build_dir.name}",
+        ]
+        if passes > 1:
+            arguments.append("-draftmode")  # only the .aux is needed from this pass
+        process.setArguments(arguments + [f"{file_name}.tex"])
+        process.finished.connect(
+            lambda exit_code, status: self._finish_pdflatex_pass(
+                process,
+                (output_dir, file_name, pdf_path),
+                passes - 1,
+                exit_code,
+                status,
+            )
+        )
+        process.errorOccurred.connect(
+            lambda error: self._handle_pdflatex_error(process, error)
+        )
+        self._latex_process = process
 
-                logger.info("Successfully created PDF: %s", pdf_path)
+        self.create_button.setEnabled(False)
+        self.create_button.setText("Compiling…")
+        process.start()
+
+    def _finish_pdflatex_pass(
+        self,
+        process: QProcess,
+        target: Tuple[str, str, str],
+        passes_left: int,
+        exit_code: int,
+        status: QProcess.ExitStatus,
+    ):
+        """Run the next pass, or report the result once the last one is done"""
+        if process is not self._latex_process:
+            return
+        process.deleteLater()
+        output_dir, file_name, pdf_path = target
+
+        if status != QProcess.ExitStatus.NormalExit or exit_code != 0:
+            # pdflatex reports errors on stdout; the end of the log has the cause
+            output = bytes(process.readAllStandardOutput()).decode(errors="replace")
+            logger.error("pdflatex error: %s", output)
+            self._fail_pdflatex(f"PDF generation failed. Error: {output[-1000:]}")
+            return
 
-                os.chdir(original_dir)
+        if passes_left > 0:
+            self._start_pdflatex(output_dir, file_name, pdf_path, passes=passes_left)
+            return
 
-                logger.info(
-                    "[Signal] Emitting resume_created signal for newly created PDF: %s",
-                    pdf_path,
-                )
-                self.resume_created.emit(pdf_path)
+        built_pdf = os.path.join(self._latex_build_dir.name, f"{file_name}.pdf")
+        if not os.path.exists(built_pdf):
+            self._fail_pdflatex("PDF file was not created")
+            return
+        shutil.move(built_pdf, pdf_path)
+        self._end_pdflatex()
+
+        logger.info("Successfully created PDF: %s", pdf_path)
+        self._exists_cache.pop(pdf_path, None)
+        logger.info(
+            "[Signal] Emitting resume_created signal for newly created PDF: %s",
+            pdf_path,
+        )
+        self.resume_created.emit(pdf_path)
 
-                self.create_button.setEnabled(False)
-                self.create_button.setText("PDF Already Exists")
+        self.create_button.setEnabled(False)
+        self.create_button.setText("PDF Already Exists")
 
-                QMessageBox.information(
-                    self,
-                    "Resume Created",
-                    f"Resume PDF successfully generated at:\n{pdf_path}",
-                )
+        QMessageBox.information(
+            self,
+            "Resume Created",
+            f"Resume PDF successfully generated at:\n{pdf_path}",
+        )
 
-                self.accept()
+        self.accept()
 
-            finally:
-                os.chdir(original_dir)
+    def _handle_pdflatex_error(self, process: QProcess, error: QProcess.ProcessError):
+        """Report a pdflatex that could not be started at all"""
+        if (
+            process is not self._latex_process
+            or error != QProcess.ProcessError.FailedToStart
+        ):
+            return
+        process.deleteLater()
+        self._fail_pdflatex(f"Could not run pdflatex: {process.errorString()}")
+
+    def _fail_pdflatex(self, message: str):
+        """Show a compilation failure and hand the form back to the user"""
+        self._end_pdflatex()
+        logger.error("Error creating resume: %s", message)
+        QMessageBox.critical(
+            self, "Error Creating Resume", f"Failed to create resume: {message}"
+        )
+        self.update_preview()
 
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            logger.error("Error creating resume: %s", str(e))
-            QMessageBox.critical(
-                self, "Error Creating Resume", f"Failed to create resume: {str(e)}"
-            )
+    def reject(self):
+        """Stop an in-flight compilation when the dialog is cancelled"""
+        process = self._latex_process
+        if process is not None:
+            self._end_pdflatex()
+            process.kill()
+        super().reject()
+
+    def _end_pdflatex(self):
+        """Forget the running compilation and remove its scratch directory"""
+        self._latex_process = None
+        if self._latex_build_dir is not None:
+            self._latex_build_dir.cleanup()
+            self._latex_build_dir = None
@@ -4,14 +4,11 @@ Ollama wrapper for the LLM model.
 
 import logging
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, ClassVar, Iterator, List
 
-from dotenv import load_dotenv
-from ollama import chat
+from ollama import Client
 from utils import setup_process_logging, Config
 
-load_dotenv()
-
 
 @dataclass
 class OllamaModelConfig:
@@ -29,6 +26,8 @@ class OllamaModelConfig:
     max_tokens: Optional[int] = 4096
     top_p: float = 0.95
     system_prompt: str = "You are a helpful assistant."
+    # number of user/assistant exchanges kept as context, None keeps them all
+    max_history_turns: Optional[int] = 20
 
 
 class OllamaClient:
@@ -36,34 +35,92 @@ class OllamaClient:
     Generates text using the Ollama API.
     """
 
+    # one HTTP connection pool shared by every client instead of one per call
+    _client: ClassVar[Client] = Client()
+
     def __init__(self, config: OllamaModelConfig):
         self.config = config
         setup_process_logging()
         self.logger = logging.getLogger(__name__)
         self._messages = [{"role": "system", "content": config.system_prompt}]
 
-    def complete(self, text: str) -> Dict[str, Any]:
+    def complete(self, text: str, *, use_history: bool = True) -> Dict[str, Any]:
         """
         Completes text using the LLM.
+
+        With use_history=False only the system prompt and this input are sent,
+        and the exchange is not added to the conversation.
         """
         self.logger.info("Generating text for input: %s", text)
         try:
-            self._messages.append({"role": "user", "content": text})
-            response = chat(
+            messages = self._request_messages(text, use_history)
+            response = self._client.chat(
                 model=self.config.model,
-                messages=self._messages,
-                options={
-                    "temperature": self.config.temperature,
-                    "num_predict": self.config.max_tokens,
-                    "top_p": self.config.top_p,
-                },
+                messages=messages,
+                options=self._options(),
             )
-            self._messages.append(response["message"])
+            if use_history:
+                self._remember(response["message"])
             return response
         except Exception as e:
             self.logger.error("Error generating text: %s", str(e), exc_info=True)
             raise
 
+    def stream(self, text: str, *, use_history: bool = True) -> Iterator[str]:
+        """
+        Completes text using the LLM, yielding the reply as it is generated.
+        """
+        self.logger.info("Streaming text for input: %s", text)
+        messages = self._request_messages(text, use_history)
+        parts = []
+        try:
+            for chunk in self._client.chat(
+                model=self.config.model,
+                messages=messages,
+                options=self._options(),
+                stream=True,
+            ):
+                part = chunk["message"]["content"]
+                parts.append(part)
+                yield part
+        except Exception as e:
+            self.logger.error("Error generating text: %s", str(e), exc_info=True)
+            raise
+        finally:
+            # keep whatever was received, even if the caller stopped reading early
+            if use_history:
+                self._remember({"role": "assistant", "content": "".join(parts)})
+
+    def _request_messages(self, text: str, use_history: bool) -> List[Dict[str, Any]]:
+        """
+        Messages to send for a new user input.
+        """
+        message = {"role": "user", "content": text}
+        if not use_history:
+            return [self._messages[0], message]
+        self._messages.append(message)
+        return self._messages
+
+    def _remember(self, reply: Dict[str, Any]):
+        """
+        Add a reply to the conversation, dropping the oldest exchanges past the limit.
+        """
+        self._messages.append(reply)
+        max_turns = self.config.max_history_turns
+        if max_turns is not None:
+            # the list is trimmed in place; index 0 is always the system prompt
+            del self._messages[1 : max(1, len(self._messages) - 2 * max_turns)]
+
+    def _options(self) -> Dict[str, Any]:
+        """
+        Sampling options sent with every request.
+        """
+        return {
+            "temperature": self.config.temperature,
+            "num_predict": self.config.max_tokens,
+            "top_p": self.config.top_p,
+        }
+
 
 if __name__ == "__main__":
     client = OllamaClient(OllamaModelConfig())
@@ -6,7 +6,6 @@ import multiprocessing
 import logging
 import os
 import sys
-from dotenv import load_dotenv
 
 # pylint: disable=no-name-in-module
 from PyQt6.QtWidgets import QApplication
@@ -14,10 +13,10 @@ from voice.listener import stream_record
 from voice.transcriber import run_transcriber
 from gui.job_window import JobApplicationWindow
 from gui.main_window import MainWindow
-from utils import setup_process_logging
+from utils import setup_process_logging, start_log_listener
 
 
-def setup_logging(name):
+def setup_logging(name, log_queue=None):
     """
     Setup logging for the given name.
     """
@@ -27,17 +26,29 @@ def setup_logging(name):
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
 
-    setup_process_logging(level=log_level)
+    setup_process_logging(level=log_level, log_queue=log_queue)
     return logging.getLogger(name)
 
 
-def run_listener(logger):
+def log_unhandled_exception(exc_type, exc_value, exc_tb):
+    """
+    Log exceptions that escape Qt slots instead of letting PyQt abort.
+    """
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc_value, exc_tb)
+        return
+    logging.getLogger("main").critical(
+        "Unhandled exception", exc_info=(exc_type, exc_value, exc_tb)
+    )
+
+
+def run_listener(logger, log_queue):
     """
     Run the audio listener process.
     """
     logger.info("Starting audio listener")
     try:
-        stream_record(logger)
+        stream_record(logger, log_queue)
     # pylint: disable=broad-exception-caught
     except Exception as e:
         logger.error(f"Error in listener process: {str(e)}", exc_info=True)
@@ -47,9 +58,9 @@ def main():
     """
     Main entry point.
     """
-    load_dotenv()
-
-    logger = setup_logging("main")
+    # every process forwards its records here so only one handle writes the log file
+    log_listener = start_log_listener(level=os.getenv("LOG_LEVEL", "INFO"))
+    logger = setup_logging("main", log_listener.queue)
     logger.info("Starting voice assistant")
 
     logger.debug("Logging directory: %s", os.path.abspath("logs"))
@@ -57,6 +68,7 @@ def main():
     window_queue = multiprocessing.Queue()
     logger.info("Created communication queues")
 
+    sys.excepthook = log_unhandled_exception
     app = QApplication(sys.argv)
     # have to create the window before starting the processes, but not using it anywhere
     _main_window = MainWindow()
@@ -66,9 +78,13 @@ def main():
     logger.info("Created Qt window")
 
     processes = [
-        multiprocessing.Process(target=run_listener, args=(setup_logging("listener"),)),
         multiprocessing.Process(
-            target=run_transcriber, args=(setup_logging("transcriber"), window_queue)
+            target=run_listener,
+            args=(logging.getLogger("listener"), log_listener.queue),
+        ),
+        multiprocessing.Process(
+            target=run_transcriber,
+            args=(logging.getLogger("transcriber"), window_queue, log_listener.queue),
         ),
     ]
 
@@ -90,6 +106,7 @@ def main():
             process.terminate()
             process.join()
         logger.info("All processes terminated")
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -2,153 +2,169 @@
 Test the ollama completion
 """
 
-from unittest.mock import patch, Mock
+# pylint: disable=redefined-outer-name,protected-access
+
+import copy
+
 import pytest
 from llm import OllamaClient, OllamaModelConfig
 
 
-def test_ollama_completion_success():
+@pytest.fixture(autouse=True)
+def no_log_files(mocker):
     """
-    Test that the ollama completion is successful
+    Keep OllamaClient from attaching handlers that write to the real logs directory
     """
+    mocker.patch("llm.setup_process_logging")
 
-    mock_response = {
-        "message": {"role": "assistant", "content": "This is a test completion"},
-        "model": "llama3.2",
-    }
 
-    config = OllamaModelConfig(model="llama3.2")
-    client = OllamaClient(config)
+@pytest.fixture
+def config():
+    """
+    Model config shared by the tests
+    """
+    return OllamaModelConfig(model="llama3.2")
 
-    with patch("llm.chat") as mock_chat:
-        mock_chat.return_value = mock_response
 
-        response = client.complete("Write a test")
+@pytest.fixture
+def client(config):
+    """
+    Client built from the shared config
+    """
+    return OllamaClient(config)
 
-        call_args = mock_chat.call_args[1]
-        assert call_args["model"] == "llama3.2"
-        assert len(call_args["messages"]) == 3  # system + user + assistant
-        assert call_args["messages"][0] == {
-            "role": "system",
-            "content": config.system_prompt,
-        }
-        assert call_args["messages"][1] == {"role": "user", "content": "Write a test"}
-        assert call_args["options"] == {
+
+@pytest.fixture
+def mock_chat(mocker):
+    """
+    Replace the shared ollama client's chat method for one test
+    """
+    return mocker.patch.object(OllamaClient._client, "chat")
+
+
+def record_requests(mock_chat, replies):
+    """
+    Answer each chat call with the next reply and keep a copy of the messages sent
+    """
+    sent = []
+    replies = iter(replies)
+
+    def chat(**kwargs):
+        # the client reuses its history list, so copy it as it was at call time
+        sent.append(copy.deepcopy(kwargs["messages"]))
+        return next(replies)
+
+    mock_chat.side_effect = chat
+    return sent
+
+
+@pytest.mark.parametrize(
+    "prompts, replies",
+    [
+        (["Write a test"], ["This is a test completion"]),
+        (["First message", "Second message"], ["First response", "Second response"]),
+        (
+            ["Hello!", "What's the weather?"],
+            ["Hi there! How can I help?", "I'm not sure how to respond to that."],
+        ),
+    ],
+    ids=["single", "history", "multi-turn"],
+)
+def test_ollama_completion(config, client, mock_chat, prompts, replies):
+    """
+    Test that completions return the replies and keep the conversation history
+    """
+    sent = record_requests(
+        mock_chat,
+        [
+            {"message": {"role": "assistant", "content": reply}, "model": "llama3.2"}
+            for reply in replies
+        ],
+    )
+
+    history = [{"role": "system", "content": config.system_prompt}]
+    expected = []
+    for prompt, reply in zip(prompts, replies):
+        response = client.complete(prompt)
+        assert response["message"]["content"] == reply
+        assert response["model"] == "llama3.2"
+        history.append({"role": "user", "content": prompt})
+        expected.append(list(history))
+        history.append({"role": "assistant", "content": reply})
+
+    assert sent == expected
+    assert client._messages == history
+    for call in mock_chat.call_args_list:
+        assert call.kwargs["model"] == "llama3.2"
+        assert call.kwargs["options"] == {
             "temperature": config.temperature,
             "num_predict": config.max_tokens,
             "top_p": config.top_p,
         }
 
-        assert response["message"]["content"] == "This is a test completion"
-        assert response["model"] == "llama3.2"
 
-
-def test_ollama_completion_error():
+def test_ollama_completion_error(client, mock_chat):
     """
     Test that errors are properly handled
     """
-    config = OllamaModelConfig(model="llama3.2")
-    client = OllamaClient(config)
+    mock_chat.side_effect = Exception("Connection error")
 
-    with patch("llm.chat") as mock_chat:
-        mock_chat.side_effect = Exception("Connection error")
+    with pytest.raises(Exception) as exc_info:
+        client.complete("Write a test")
 
-        with pytest.raises(Exception) as exc_info:
-            client.complete("Write a test")
+    assert str(exc_info.value) == "Connection error"
 
-        assert str(exc_info.value) == "Connection error"
 
-
-def test_ollama_completion_conversation_history():
+def test_ollama_history_is_bounded(mock_chat):
     """
-    Test that conversation history is properly maintained
+    Test that old exchanges are dropped and stateless calls are not recorded
     """
-    config = OllamaModelConfig(model="llama3.2")
+    config = OllamaModelConfig(model="llama3.2", max_history_turns=1)
     client = OllamaClient(config)
-
-    mock_responses = [
-        {
-            "message": {"role": "assistant", "content": "First response"},
-            "model": "llama3.2",
-        },
-        {
-            "message": {"role": "assistant", "content": "Second response"},
-            "model": "llama3.2",
-        },
+    reply = {"role": "assistant", "content": "Reply"}
+    sent = record_requests(
+        mock_chat, [{"message": dict(reply), "model": "llama3.2"} for _ in range(3)]
+    )
+    system = {"role": "system", "content": config.system_prompt}
+
+    client.complete("First message")
+    client.complete("Second message")
+    client.complete("One-off", use_history=False)
+
+    assert sent == [
+        [system, {"role": "user", "content": "First message"}],
+        [
+            system,
+            {"role": "user", "content": "First message"},
+            reply,
+            {"role": "user", "content": "Second message"},
+        ],
+        [system, {"role": "user", "content": "One-off"}],
+    ]
+    assert client._messages == [
+        system,
+        {"role": "user", "content": "Second message"},
+        reply,
     ]
-
-    with patch("llm.chat") as mock_chat:
-        mock_chat.side_effect = mock_responses
-
-        response1 = client.complete("First message")
-        assert response1["message"]["content"] == "First response"
-
-        response2 = client.complete("Second message")
-        assert response2["message"]["content"] == "Second response"
-
-        last_call_args = mock_chat.call_args[1]
-        messages = last_call_args["messages"]
-
-        assert len(messages) == 5  # system + user1 + assistant1 + user2 + assistant2
-        assert messages[0]["role"] == "system"
-        assert messages[1]["role"] == "user"
-        assert messages[1]["content"] == "First message"
-        assert messages[2]["role"] == "assistant"
-        assert messages[2]["content"] == "First response"
-        assert messages[3]["role"] == "user"
-        assert messages[3]["content"] == "Second message"
-        assert messages[4]["role"] == "assistant"
-        assert messages[4]["content"] == "Second response"
 
 
-def test_ollama_completion_with_mock_tracking():
+def test_ollama_stream(config, client, mock_chat):
     """
-    Test demonstrating advanced Mock usage with call tracking and custom responses
+    Test that streamed chunks are yielded and recorded in the history
     """
-    config = OllamaModelConfig(model="llama3.2")
-    client = OllamaClient(config)
-
-    mock_chat = Mock(name="chat_function")
-
-    def chat_side_effect(model, messages, _options):
-        chat_side_effect.called_with_prompts.append(messages[-1]["content"])
-
-        if "hello" in messages[-1]["content"].lower():
-            return {
-                "message": {
-                    "role": "assistant",
-                    "content": "Hi there! How can I help?",
-                },
-                "model": model,
-            }
-        else:
-            return {
-                "message": {
-                    "role": "assistant",
-                    "content": "I'm not sure how to respond to that.",
-                },
-                "model": model,
-            }
-
-    chat_side_effect.called_with_prompts = []
-
-    mock_chat.side_effect = chat_side_effect
-
-    with patch("llm.chat", mock_chat):
-        response1 = client.complete("Hello!")
-        response2 = client.complete("What's the weather?")
-
-        assert response1["message"]["content"] == "Hi there! How can I help?"
-        assert response2["message"]["content"] == "I'm not sure how to respond to that."
-
-        assert mock_chat.call_count == 2
-        assert chat_side_effect.called_with_prompts == ["Hello!", "What's the weather?"]
-
-        first_call = mock_chat.call_args_list[0]
-        second_call = mock_chat.call_args_list[1]
+    chunks = [
+        {"message": {"role": "assistant", "content": "Hello"}},
+        {"message": {"role": "assistant", "content": " world"}},
+    ]
+    sent = record_requests(mock_chat, [iter(chunks)])
 
-        assert first_call[1]["model"] == "llama3.2"
-        assert second_call[1]["model"] == "llama3.2"
+    assert list(client.stream("Greet me")) == ["Hello", " world"]
 
-        assert first_call[1]["options"]["temperature"] == config.temperature
-        assert second_call[1]["options"]["temperature"] == config.temperature
+    assert mock_chat.call_args.kwargs["stream"] is True
+    assert sent == [
+        [
+            {"role": "system", "content": config.system_prompt},
+            {"role": "user", "content": "Greet me"},
+        ]
+    ]
+    assert client._messages[-1] == {"role": "assistant", "content": "Hello world"}
@@ -0,0 +1,89 @@
+"""
+Test the resume creator's template search and slug helpers
+"""
+
+import logging
+import mmap
+import re
+
+import pytest
+from gui.widgets.resume_creator import (
+    RG_MAX_MATCHES,
+    _slug,
+    match_lines,
+    search_large_template,
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("foo\nbar\n", [(1, "foo")]),
+        ("bar\nbaz\nfoo", [(3, "foo")]),
+        ("foo and foo\nbar\nfoo", [(1, "foo and foo"), (3, "foo")]),
+        ("bar\r\nfoo\r\nbaz\r\n", [(2, "foo")]),
+        ("bar\nbaz\n", []),
+    ],
+    ids=["first-line", "last-line-no-newline", "repeat-on-line", "crlf", "none"],
+)
+def test_match_lines(text, expected):
+    """
+    Test that matching lines are numbered from 1 and returned without terminators
+    """
+    assert match_lines(text, re.compile("foo"), "\n") == expected
+
+
+def test_match_lines_is_capped():
+    """
+    Test that the scan stops after the configured number of matching lines
+    """
+    text = "\n".join(f"foo {i}" for i in range(RG_MAX_MATCHES + 2))
+
+    matches = match_lines(text, re.compile("foo"), "\n")
+
+    assert matches == [(i + 1, f"foo {i}") for i in range(RG_MAX_MATCHES)]
+
+
+def test_match_lines_mmap_matches_str(tmp_path):
+    """
+    Test that an mmap buffer gives the same lines as the decoded text
+    """
+    text = "\\section{Experience}\r\nfoo\n\nbar foo foo\nbaz\nfoo"
+    path = tmp_path / "resume.tex"
+    path.write_bytes(text.encode("utf-8"))
+
+    expected = match_lines(text, re.compile("foo"), "\n")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        from_mmap = match_lines(mm, re.compile(b"foo"), b"\n")
+
+    assert [(n, line.decode("utf-8")) for n, line in from_mmap] == expected
+    assert search_large_template(str(path), re.compile(b"foo")) == expected
+
+
+def test_search_large_template_empty_file(tmp_path, caplog):
+    """
+    Test that an empty template has no matches and is not reported as an error
+    """
+    path = tmp_path / "empty.tex"
+    path.write_bytes(b"")
+
+    with caplog.at_level(logging.ERROR):
+        assert search_large_template(str(path), re.compile(b"foo")) == []
+
+    assert not caplog.records
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Acme Corp", "acme-corp"),
+        ("  Software Engineer II ", "software-engineer-ii"),
+        ("Café Zürich", "caf--z-rich"),
+        ("東京 Labs", "---labs"),
+    ],
+)
+def test_slug(text, expected):
+    """
+    Test that everything outside ASCII letters and digits becomes a dash
+    """
+    assert _slug(text) == expected
@@ -2,21 +2,28 @@
 Shared utilities for lemon river
 """
 
+import functools
 import logging
+import multiprocessing
 import sys
 import os
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
+# the only place .env is parsed; every module reads settings through utils
 load_dotenv()
 
 
 class Config:
     """
     Configuration manager that reads from environment variables.
+
+    Named settings are read once per process and cached; the get_* helpers
+    always read the current environment.
     """
 
     @staticmethod
@@ -55,6 +62,7 @@ class Config:
         return value.lower() in ("true", "1", "t", "yes", "y")
 
     @staticmethod
+    @functools.cache
     def microphone_index() -> Optional[int]:
         """Get microphone index. None means use system default."""
         value = os.getenv("MICROPHONE_INDEX")
@@ -66,89 +74,94 @@ class Config:
             return None
 
     @staticmethod
+    @functools.cache
     def max_queue_size() -> int:
         """Get maximum queue size."""
         return Config.get_int("MAX_QUEUE_SIZE", 0)
 
     @staticmethod
+    @functools.cache
     def process_timeout() -> int:
         """Get process timeout in seconds."""
         return Config.get_int("PROCESS_TIMEOUT", 5)
 
     @staticmethod
+    @functools.cache
     def debug_mode() -> bool:
         """Check if debug mode is enabled."""
         return Config.get_bool("DEBUG_MODE", False)
 
     @staticmethod
+    @functools.cache
     def activation_phrase() -> str:
         """Get voice activation phrase."""
         return Config.get_str("ACTIVATION_PHRASE", "lemon river").lower()
 
     @staticmethod
+    @functools.cache
     def deactivation_phrase() -> str:
         """Get voice deactivation phrase."""
         return Config.get_str("DEACTIVATION_PHRASE", "lemon sneeze").lower()
 
     @staticmethod
+    @functools.cache
     def save_phrase() -> str:
         """Get voice save phrase."""
         return Config.get_str("SAVE_PHRASE", "lemon save").lower()
 
     @staticmethod
+    @functools.cache
     def llm_model() -> str:
         """Get LLM model name."""
         return Config.get_str("LLM_MODEL", "llama3.2")
 
     @staticmethod
+    @functools.cache
     def audio_recording_sample_rate() -> int:
         """Get audio recording sample rate."""
         return Config.get_int("AUDIO_RECORDING_SAMPLE_RATE", 44100)
 
     @staticmethod
+    @functools.cache
     def audio_chunk_duration() -> float:
         """Get audio chunk duration in seconds."""
         return Config.get_float("AUDIO_CHUNK_DURATION", 0.5)
 
     @staticmethod
+    @functools.cache
     def audio_silence_threshold() -> float:
         """Get silence threshold for audio detection."""
         return Config.get_float("AUDIO_SILENCE_THRESHOLD", 0.01)
 
     @staticmethod
+    @functools.cache
     def audio_silence_duration() -> float:
         """Get duration of silence that ends recording (in seconds)."""
         return Config.get_float("AUDIO_SILENCE_DURATION", 1.5)
 
     @staticmethod
+    @functools.cache
     def recordings_dir() -> str:
         """Get the directory path for audio recordings."""
         return Config.get_str("RECORDINGS_DIR", "./recordings")
 
 
-def setup_process_logging(
-    level: str = os.getenv("LOG_LEVEL", "DEBUG"),
-    log_dir: str = os.getenv("LOG_DIR", "logs"),
-):
-    """
-    Setup logging for a new process.
-    """
-    root_logger = logging.getLogger()
-
-    log_level = getattr(logging, level.upper(), logging.DEBUG)
-    root_logger.setLevel(log_level)
+# queue of the log listener in the main process, set once this process forwards to it
+_log_queue: Optional[multiprocessing.Queue] = None
 
-    root_logger.handlers = []
-
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
 
+def _log_handlers(log_level: int, log_dir: str) -> List[logging.Handler]:
+    """
+    Build the console and file handlers that actually write log records.
+    """
     log_format = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
-    console_handler.setFormatter(log_format)
 
-    root_logger.addHandler(console_handler)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(log_format)
+    handlers = [console_handler]
 
     if log_dir:
         Path(log_dir).mkdir(parents=True, exist_ok=True)
@@ -157,7 +170,59 @@ def setup_process_logging(
         file_handler = logging.FileHandler(Path(log_dir) / log_filename)
         file_handler.setLevel(log_level)
         file_handler.setFormatter(log_format)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    return handlers
+
+
+def start_log_listener(
+    level: str = os.getenv("LOG_LEVEL", "DEBUG"),
+    log_dir: str = os.getenv("LOG_DIR", "logs"),
+) -> QueueListener:
+    """
+    Start the single writer for every process's logs.
+
+    Pass listener.queue to setup_process_logging in each process and call
+    listener.stop() on shutdown to flush and close the log file.
+    """
+    log_level = getattr(logging, level.upper(), logging.DEBUG)
+    listener = QueueListener(
+        multiprocessing.Queue(-1),
+        *_log_handlers(log_level, log_dir),
+        respect_handler_level=True,
+    )
+    listener.start()
+    return listener
+
+
+def setup_process_logging(
+    level: str = os.getenv("LOG_LEVEL", "DEBUG"),
+    log_dir: str = os.getenv("LOG_DIR", "logs"),
+    log_queue: Optional[multiprocessing.Queue] = None,
+):
+    """
+    Setup logging for a new process.
+
+    Once a log_queue has been given, records from this process are forwarded
+    to the log listener instead of opening another handle on the log file.
+    """
+    global _log_queue  # pylint: disable=global-statement
+
+    root_logger = logging.getLogger()
+
+    log_level = getattr(logging, level.upper(), logging.DEBUG)
+    root_logger.setLevel(log_level)
+
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+
+    _log_queue = log_queue or _log_queue
+    if _log_queue is not None:
+        root_logger.addHandler(QueueHandler(_log_queue))
+    else:
+        for handler in _log_handlers(log_level, log_dir):
+            root_logger.addHandler(handler)
 
     logging.getLogger("httpcore.http11").setLevel(logging.WARNING)
 
@@ -2,14 +2,15 @@
 Stream audio from the microphone and save it to a WAV file.
 """
 
-import datetime
+import math
 import os
 import sys
+import time
 from collections import deque
 
 import sounddevice as sd
 import numpy as np
-import wavio as wv
+import soundfile as sf
 from utils import setup_process_logging, Config
 
 # imported from .env
@@ -19,23 +20,65 @@ CHUNK_SIZE = int(SAMPLE_RATE * CHUNK_DURATION)
 SILENCE_THRESHOLD = Config.audio_silence_threshold()
 SILENCE_DURATION = Config.audio_silence_duration()
 RECORDINGS_DIR = Config.recordings_dir()
+INITIAL_BUFFER_SECONDS = 30
 
 os.makedirs(RECORDINGS_DIR, exist_ok=True)
+RECORDING_PREFIX = os.path.join(RECORDINGS_DIR, "")
 
 
 def rms(data):
     """Calculate Root Mean Square (RMS) of audio data."""
-    return np.sqrt(np.mean(np.square(data)))
-
-
-def stream_record(logger):
+    return math.sqrt(float(np.dot(data, data)) / data.size)
+
+
+class RecordingBuffer:
+    """Growable float32 buffer addressed by absolute sample offsets."""
+
+    def __init__(self, capacity):
+        self._data = np.empty(capacity, dtype=np.float32)
+        self._base = 0  # absolute offset of self._data[0]
+        self._keep_from = 0
+        self.end = 0
+
+    def append(self, chunk):
+        """Copy a chunk into the buffer and return its absolute start offset."""
+        start = self.end
+        live = self.end - self._keep_from
+        if self.end - self._base + len(chunk) > self._data.size:
+            # drop samples nobody needs before growing the array
+            kept = self._data[self._keep_from - self._base : self.end - self._base]
+            if live + len(chunk) > self._data.size // 2:
+                data = np.empty(
+                    max(self._data.size * 2, live + len(chunk)), dtype=np.float32
+                )
+                data[:live] = kept
+                self._data = data
+            else:
+                self._data[:live] = kept
+            self._base = self._keep_from
+        offset = self.end - self._base
+        self._data[offset : offset + len(chunk)] = chunk
+        self.end += len(chunk)
+        return start
+
+    def discard_before(self, offset):
+        """Allow samples before the absolute offset to be reused."""
+        self._keep_from = max(self._keep_from, min(offset, self.end))
+
+    def since(self, offset):
+        """Return a view of the samples from the absolute offset to the end."""
+        return self._data[offset - self._base : self.end - self._base]
+
+
+def stream_record(logger, log_queue=None):
     """Stream audio from the microphone and save it to a WAV file."""
-    setup_process_logging()
+    setup_process_logging(log_queue=log_queue)
 
     buffer = deque(maxlen=int(SILENCE_DURATION / CHUNK_DURATION))
-    full_buffer = []
+    recording = RecordingBuffer(int(SAMPLE_RATE * INITIAL_BUFFER_SECONDS))
+    loud_chunks = 0
     is_recording = False
-    speech_start_index = 0
+    speech_start = 0
 
     logger.info("Recording... Speak into the microphone.")
     logger.info(f"Using sample rate: {SAMPLE_RATE}, chunk size: {CHUNK_SIZE}")
@@ -44,38 +87,45 @@ def stream_record(logger):
     )
 
     def callback(indata, _frames, _time, status):
-        nonlocal is_recording, speech_start_index, full_buffer
+        nonlocal is_recording, speech_start, loud_chunks
 
         if status:
             logger.error("Error: %s", status)
 
-        mono_data = indata.flatten()
-        full_buffer.append(mono_data)
-        buffer.append(mono_data)
+        mono_data = indata[:, 0]
+        start = recording.append(mono_data)
 
         loudness = rms(mono_data)
         # logger.debug("Loudness: %f", loudness)
         has_speech = loudness > SILENCE_THRESHOLD
 
+        # keep a running count of loud chunks so the silence check is O(1)
+        if buffer and len(buffer) == buffer.maxlen and buffer[0][1] > SILENCE_THRESHOLD:
+            loud_chunks -= 1
+        buffer.append((start, loudness))
+        if has_speech:
+            loud_chunks += 1
+
         if has_speech:
             if not is_recording:
                 logger.info("Speech detected. Starting recording...")
                 is_recording = True
-                speech_start_index = len(full_buffer) - len(buffer)
+                speech_start = buffer[0][0]
         else:
-            if (
-                is_recording
-                and len(buffer) == buffer.maxlen
-                and all(rms(chunk) <= SILENCE_THRESHOLD for chunk in buffer)
-            ):
+            if is_recording and len(buffer) == buffer.maxlen and loud_chunks == 0:
                 logger.info("Silence detected. Stopping recording.")
-                save_recording(full_buffer[speech_start_index:], logger)
+                save_recording(recording.since(speech_start), logger)
                 buffer.clear()
                 is_recording = False
 
+        if not is_recording:
+            # only the silence window can become part of the next recording
+            recording.discard_before(buffer[0][0] if buffer else recording.end)
+
     with sd.InputStream(
         callback=callback,
         channels=1,
+        dtype="float32",
         samplerate=SAMPLE_RATE,
         blocksize=CHUNK_SIZE,
         device=Config.microphone_index(),
@@ -87,19 +137,21 @@ def stream_record(logger):
         finally:
             if is_recording:
                 logger.info("Finalizing recording...")
-                save_recording(full_buffer[speech_start_index:], logger)
+                save_recording(recording.since(speech_start), logger)
             logger.info("Recording stopped.")
 
 
 def save_recording(audio_data, logger):
     """Save the buffered audio to a WAV file."""
-    if not audio_data:
+    if not audio_data.size:
         return
-    audio_data = np.concatenate(audio_data)
-    ts = datetime.datetime.now()
-    filename = ts.strftime("%Y-%m-%d %H-%M-%S") + ".wav"
-    file_path = os.path.join(RECORDINGS_DIR, filename)
-    wv.write(file_path, audio_data, SAMPLE_RATE, sampwidth=2)
+    # nanosecond names never collide, unlike second-resolution timestamps
+    file_path = f"{RECORDING_PREFIX}{time.time_ns()}.wav"
+    # write under a temporary name so the transcriber never sees a partial file
+    partial_path = file_path + ".part"
+    # libsndfile converts to 16-bit PCM in C, saturating out-of-range samples
+    sf.write(partial_path, audio_data, SAMPLE_RATE, subtype="PCM_16", format="WAV")
+    os.replace(partial_path, file_path)
     logger.info("Saved recording to %s", file_path)
 
 
@@ -3,72 +3,120 @@ Transcribes audio recordings in the recordings directory.
 Uses MLX Whisper for transcription.
 """
 
-import glob
 import os
-import time
+import queue
 from multiprocessing import Process, Queue
+import mlx.core as mx
 import mlx_whisper
-from dotenv import load_dotenv
+from mlx_whisper.transcribe import ModelHolder
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
 from utils import setup_process_logging, Config
 from agent.voice_processor import process_transcriptions
 
-load_dotenv()
+RECORDING_SUFFIX = ".wav"
+WHISPER_MODEL = "mlx-community/whisper-small.en-mlx"
 
 
-def run_transcriber(logger, window_queue):
+class RecordingHandler(FileSystemEventHandler):
+    """Queue recordings as they appear in the recordings directory."""
+
+    def __init__(self, recordings):
+        super().__init__()
+        self._recordings = recordings
+
+    def on_created(self, event):
+        self._enqueue(event.src_path, event.is_directory)
+
+    def on_moved(self, event):
+        # the listener renames finished recordings into place
+        self._enqueue(event.dest_path, event.is_directory)
+
+    def _enqueue(self, path, is_directory):
+        path = os.fsdecode(path)
+        if not is_directory and path.endswith(RECORDING_SUFFIX):
+            self._recordings.put(path)
+
+
+def existing_recordings(recordings_dir):
+    """Return recordings left over from a previous run, oldest first."""
+    with os.scandir(recordings_dir) as entries:
+        paths = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(RECORDING_SUFFIX) and entry.is_file()
+        ]
+    return sorted(paths, key=os.path.getctime)
+
+
+def run_transcriber(logger, window_queue, log_queue=None):
     """
     Transcribes audio recordings and sends them to LLM processor via queue.
     """
-    setup_process_logging()
+    setup_process_logging(log_queue=log_queue)
 
     transcription_queue = Queue(maxsize=Config.max_queue_size())
     processor = Process(
-        target=process_transcriptions, args=(transcription_queue, window_queue, logger)
+        target=process_transcriptions,
+        args=(transcription_queue, window_queue, logger, log_queue),
     )
     processor.start()
 
     logger.info("Starting transcriber")
-    recordings_dir = os.path.join(Config.recordings_dir(), "*")
-    transcribed = set()
+    recordings_dir = Config.recordings_dir()
+    os.makedirs(recordings_dir, exist_ok=True)
+    recordings = queue.Queue()
+    observer = Observer()
+    observer.schedule(RecordingHandler(recordings), recordings_dir)
+    observer.start()
+    for path in existing_recordings(recordings_dir):
+        recordings.put(path)
 
     try:
+        # load the weights now so the first recording doesn't wait for them;
+        # transcribe() reuses the held model as long as the repo matches
+        logger.info(f"Loading whisper model {WHISPER_MODEL}")
+        ModelHolder.get_model(WHISPER_MODEL, mx.float16)
+
         while True:
-            files = sorted(
-                glob.iglob(recordings_dir), key=os.path.getctime, reverse=True
-            )
-            if len(files) < 1:
-                time.sleep(0.1)
+            latest_recording = recordings.get()
+            # duplicate events for a file that was already transcribed
+            if not os.path.exists(latest_recording):
                 continue
 
-            latest_recording = files[0]
-            if os.path.exists(latest_recording) and latest_recording not in transcribed:
-                logger.info(f"Transcribing {latest_recording}")
-                try:
-                    result = mlx_whisper.transcribe(
-                        latest_recording,
-                        path_or_hf_repo="mlx-community/whisper-small.en-mlx",
-                    )
-                    text = result["text"]
-                    logger.info(f"Transcribed text: {text}")
-
-                    transcription_queue.put(text)
-
-                    os.remove(latest_recording)
-                    transcribed.add(latest_recording)
-                # pylint: disable=broad-exception-caught
-                except Exception as e:
-                    logger.error(
-                        f"Error transcribing {latest_recording}: {str(e)}",
-                        exc_info=True,
-                    )
-
-            time.sleep(0.1)
+            logger.info(f"Transcribing {latest_recording}")
+            try:
+                result = mlx_whisper.transcribe(
+                    latest_recording,
+                    path_or_hf_repo=WHISPER_MODEL,
+                )
+                text = result["text"]
+                logger.info(f"Transcribed text: {text}")
+
+                transcription_queue.put(text)
+
+                os.remove(latest_recording)
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                logger.error(
+                    f"Error transcribing {latest_recording}: {str(e)}",
+                    exc_info=True,
+                )
     # pylint: disable=broad-exception-caught
     except Exception as e:
         logger.error(f"Transcriber error: {str(e)}", exc_info=True)
     finally:
-        processor.terminate()
-        processor.join()
+        observer.stop()
+        observer.join()
+        timeout = Config.process_timeout()
+        try:
+            transcription_queue.put(None, timeout=timeout)
+            processor.join(timeout)
+        except queue.Full:
+            pass
+        if processor.is_alive():
+            processor.terminate()
+            processor.join()
 
 
 if __name__ == "__main__":